@@ -28,6 +28,10 @@ List of widget shortcuts:
     MA             ->   Matplotlib plot or imag with fast update
     PG             ->   pyqtgraph plot
     PGI            ->   pyqtgraph image
+    T              ->   Table of a 2d array, record array or DataFrame
+    WB             ->   Bank of sliders, progress bars, Leds or labels
+    LM             ->   Led matrix of status cells
+    TABS           ->   Tab widget with (optionally lazy) sub-guis
 
     QPushButtons with both image and text:
     ['image.jpg', 'text']  ->   QPushButton(QIcon('image.jpg'), 'text')
@@ -44,20 +48,26 @@ Signals can be connected with gui.events() where every widget has:
 
 import re
 import ast
+import bisect
 import sys
 import time
 import queue
 import signal
+import difflib
 import inspect
 import os.path
 import textwrap
+import traceback
+import weakref
 import functools
 import threading
 import contextlib
 from enum import Enum
 from types import SimpleNamespace
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as _FutureTimeoutError
 from functools import wraps
-from collections import namedtuple, defaultdict
+from collections import namedtuple, defaultdict, deque, OrderedDict
 from collections.abc import Sequence, Mapping, MutableSequence
 
 try:
@@ -67,10 +77,19 @@ try:
     from PyQt5.QtWidgets import QMessageBox, QListWidget, QAbstractItemView
     from PyQt5.QtWidgets import QPlainTextEdit, QHBoxLayout, QComboBox
     from PyQt5.QtWidgets import QSplashScreen, QFileDialog, QButtonGroup
-    from PyQt5.QtWidgets import QProgressBar, QGroupBox
-    from PyQt5.QtGui import QPixmap, QIcon, QFont
-    from PyQt5.QtCore import Qt, QTimer, QEvent
+    from PyQt5.QtWidgets import QProgressBar, QGroupBox, QListView, QTableView
+    from PyQt5.QtWidgets import QCompleter, QTabWidget
+    from PyQt5.QtGui import QImageReader
+    from PyQt5.QtGui import QPixmap, QIcon, QFont, QPalette, QColor, QPainter
+    from PyQt5.QtCore import Qt, QTimer, QEvent, QObject, QRect, QSize
+    from PyQt5.QtCore import QAbstractListModel, QAbstractTableModel, QModelIndex
+    from PyQt5.QtCore import QStringListModel, QFileSystemWatcher
     from PyQt5.QtCore import pyqtSignal as Signal
+    from PyQt5 import sip
+
+    def _is_deleted(qobject):
+        return sip.isdeleted(qobject)
+
 except ImportError:
     try:
         from PySide2.QtWidgets import QApplication, QLabel, QWidget, QAbstractSlider
@@ -79,9 +98,18 @@ except ImportError:
         from PySide2.QtWidgets import QMessageBox, QListWidget, QAbstractItemView
         from PySide2.QtWidgets import QPlainTextEdit, QHBoxLayout, QComboBox
         from PySide2.QtWidgets import QSplashScreen, QFileDialog, QButtonGroup
-        from PySide2.QtWidgets import QProgressBar, QGroupBox
-        from PySide2.QtGui import QPixmap, QIcon, QFont
-        from PySide2.QtCore import Qt, QTimer, Signal, QEvent
+        from PySide2.QtWidgets import QProgressBar, QGroupBox, QListView, QTableView
+        from PySide2.QtWidgets import QCompleter, QTabWidget
+        from PySide2.QtGui import QImageReader
+        from PySide2.QtGui import QPixmap, QIcon, QFont, QPalette, QColor, QPainter
+        from PySide2.QtCore import Qt, QTimer, Signal, QEvent, QObject, QRect, QSize
+        from PySide2.QtCore import QAbstractListModel, QAbstractTableModel, QModelIndex
+        from PySide2.QtCore import QStringListModel, QFileSystemWatcher
+        import shiboken2
+
+        def _is_deleted(qobject):
+            return not shiboken2.isValid(qobject)
+
     except ImportError as e:
         raise Exception('At least one of PySide2 or PyQt5 must be installed') from e
 
@@ -196,14 +224,37 @@ class ContextMixIn():
 
         return True   # Cancel the exception raised by the first execution
 
+    # Mixed-in classes for the Qt widget classes, created only once
+    # since every new class is never freed.
+    _converted_classes = {}
+
     @classmethod
     def convert_object(cls, obj):
-        '''Add this class as a mixin after an object has been created'''
+        '''Add this class as a mixin after an object has been created.
 
+        Instances of Qt classes get a mixed-in class, created once per
+        Qt class. Changing the class of an instance of a Python subclass
+        crashes PySide2 when it is deleted, so user widget classes get
+        the __enter__ and __exit__ methods added instead, unless they
+        already define any of them.
+        '''
         base_cls = obj.__class__
-        base_cls_name = obj.__class__.__name__
-        new_name = 'Context' + base_cls_name
-        obj.__class__ = type(new_name, (base_cls, cls), {})
+        if isinstance(obj, cls):
+            return
+
+        if base_cls.__module__.split('.')[0] not in ('PySide2', 'PyQt5'):
+            # hasattr() misses attributes added to Shiboken types
+            if not any('__enter__' in vars(klass) or '__exit__' in vars(klass)
+                       for klass in base_cls.__mro__):
+                base_cls.__enter__ = cls.__enter__
+                base_cls.__exit__ = cls.__exit__
+            return
+
+        if base_cls not in cls._converted_classes:
+            new_name = 'Context' + base_cls.__name__
+            cls._converted_classes[base_cls] = type(
+                new_name, (base_cls, cls), {'_context_base': base_cls})
+        obj.__class__ = cls._converted_classes[base_cls]
 
 
 class _Analyzer(ast.NodeVisitor):
@@ -216,18 +267,21 @@ class _Analyzer(ast.NodeVisitor):
     def __init__(self, decorator_name='auto'):
         self.gui_name = None
         self.accessed_widgets = set()
+        self.assigned_widgets = set()
         self.decorator_name = decorator_name
 
     def visit_Attribute(self, node):
-        '''Detect all reads like "gui.widget"'''
+        '''Detect all reads like "gui.widget" and writes like "gui.widget = x"'''
 
         if (
             isinstance(node.value, ast.Name)
             and node.value.id == self.gui_name
-            and isinstance(node.ctx, ast.Load)
             and node.attr != self.decorator_name
         ):
-            self.accessed_widgets.add(node.attr)
+            if isinstance(node.ctx, ast.Load):
+                self.accessed_widgets.add(node.attr)
+            elif isinstance(node.ctx, ast.Store):
+                self.assigned_widgets.add(node.attr)
         self.generic_visit(node)
 
     def visit_FunctionDef(self, node):
@@ -235,6 +289,9 @@ class _Analyzer(ast.NodeVisitor):
 
         decorators = node.decorator_list
         for d in decorators:
+            # Decorators with arguments like "@gui.cached(maxsize=10)"
+            if isinstance(d, ast.Call):
+                d = d.func
             if (
                 isinstance(d, ast.Attribute)
                 and d.attr == self.decorator_name
@@ -251,6 +308,203 @@ class _Analyzer(ast.NodeVisitor):
         self.generic_visit(node)
 
 
+class _AutoNode:
+    '''A function decorated with @gui.auto, with the names of the
+    properties it reads (inputs) and assigns (outputs).'''
+
+    def __init__(self, func, inputs, outputs):
+        self.func = func
+        self.inputs = frozenset(inputs)
+        self.outputs = frozenset(outputs)
+        self.runs = 0
+        self.skipped = 0
+        self._key = None
+
+
+class _AutoGraph:
+    '''Dependency graph of the @gui.auto functions of a Gui.
+
+    When an input changes, the nodes that read it are marked dirty and a
+    single flush is scheduled for the next event loop iteration. The flush
+    runs the dirty nodes once each, in topological order, so that a node
+    whose outputs are read by another one runs first. A node is skipped
+    if its input values are the same as the last time it ran.
+
+    Nodes are called with the Gui and the arguments of the latest widget
+    signal that marked them dirty, if any.
+    '''
+
+    def __init__(self, gui):
+        self._gui = gui
+        self.nodes = []
+        self._order = None
+        self._dirty = set()
+        self._args = {}          # Signal arguments for each dirty node
+        self._scheduled = False
+        self._running = None
+
+    def add(self, node):
+        self.nodes.append(node)
+        self._order = None
+
+    def clear(self):
+        self.nodes.clear()
+        self._dirty.clear()
+        self._args.clear()
+        self._order = None
+
+    def _topological_order(self):
+        '''Nodes sorted so that producers come before consumers.
+        Nodes in a cycle keep their registration order.'''
+
+        if self._order is None:
+            consumers = {node: [other for other in self.nodes
+                                if other is not node
+                                and node.outputs & other.inputs]
+                         for node in self.nodes}
+            indegree = {node: 0 for node in self.nodes}
+            for node in self.nodes:
+                for other in consumers[node]:
+                    indegree[other] += 1
+
+            order = []
+            ready = deque(node for node in self.nodes if indegree[node] == 0)
+            while ready:
+                node = ready.popleft()
+                order.append(node)
+                for other in consumers[node]:
+                    indegree[other] -= 1
+                    if indegree[other] == 0:
+                        ready.append(other)
+
+            order += [node for node in self.nodes if node not in order]
+            self._order = order
+        return self._order
+
+    def invalidate(self, name, args=()):
+        '''Mark dirty all nodes reading property *name*. *args* are the
+        arguments of the widget signal that changed it, if any.'''
+
+        for node in self.nodes:
+            if name in node.inputs and node is not self._running:
+                self._dirty.add(node)
+                if args:
+                    self._args[node] = args
+
+        if self._dirty and not self._scheduled:
+            self._scheduled = True
+            _post_to_main_thread(self.flush, ())
+
+    def _input_key(self, node):
+        properties = self._gui._guietta_properties
+        keys = []
+        for name in sorted(node.inputs):
+            if name in properties:
+                key = _value_key(properties[name].get())
+                if key is None:
+                    return None
+                keys.append(key)
+        return tuple(keys)
+
+    def flush(self):
+        '''Run all dirty nodes in topological order'''
+
+        self._scheduled = False
+        for node in self._topological_order():
+            if node not in self._dirty:
+                continue
+            self._dirty.discard(node)
+            args = self._args.pop(node, ())
+
+            key = self._input_key(node)
+            if key is not None and _same_key(key, node._key):
+                node.skipped += 1
+                continue
+
+            self._running = node
+            try:
+                _exception_wrapper(node.func, self._gui)(self._gui, *args)
+            finally:
+                self._running = None
+            node._key = key
+            node.runs += 1
+
+        # Nodes invalidated by a later node in a cycle
+        if self._dirty and not self._scheduled:
+            self._scheduled = True
+            _post_to_main_thread(self.flush, ())
+
+
+CacheInfo = namedtuple('CacheInfo', 'hits misses maxsize currsize nbytes')
+
+
+def _result_nbytes(value):
+    '''Approximate memory size of a cached result'''
+
+    nbytes = getattr(value, 'nbytes', None)
+    if isinstance(nbytes, int):
+        return nbytes
+    size = sys.getsizeof(value)
+    if isinstance(value, (list, tuple)):
+        size += sum(_result_nbytes(x) for x in value)
+    elif isinstance(value, Mapping):
+        size += sum(_result_nbytes(x) for x in value.values())
+    return size
+
+
+class _LRUCache:
+    '''Least recently used cache limited by number of items and bytes'''
+
+    def __init__(self, maxsize=128, max_bytes=None):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.nbytes = 0
+        self._items = OrderedDict()   # key -> (value, nbytes)
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value, _ = self._items[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._items.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        nbytes = _result_nbytes(value) if self.max_bytes is not None else 0
+        if self.max_bytes is not None and nbytes > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._items:
+                self.nbytes -= self._items.pop(key)[1]
+            self._items[key] = (value, nbytes)
+            self.nbytes += nbytes
+
+            while self._items and (
+                (self.maxsize is not None and len(self._items) > self.maxsize)
+                or (self.max_bytes is not None and self.nbytes > self.max_bytes)
+            ):
+                _, (_, evicted) = self._items.popitem(last=False)
+                self.nbytes -= evicted
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self.nbytes = 0
+            self.hits = self.misses = 0
+
+    def info(self):
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize,
+                             len(self._items), self.nbytes)
+
+
 ############
 # Property like get/set methods for fast widget access:
 # value = gui.name calls get()
@@ -273,9 +527,16 @@ class GuiettaProperty:
     `guietta.execute_in_main_thread` and `guietta.undo_context_manager`.
     Set *add_decorators* to False to avoid this. In this case, the
     *widget* parameter is ignored.
+
+    If *skip_unchanged* is True, assigning the same value that was
+    assigned last time does nothing, and the *skipped* counter is
+    incremented instead. The last value is forgotten when the widget
+    emits its change signal (for example when the user edits it).
+    Call invalidate() after modifying the widget with QT methods.
     '''
 
-    def __init__(self, get, set, widget, add_decorators=True):
+    def __init__(self, get, set, widget, add_decorators=True,
+                 skip_unchanged=False):
         try:
             assert(callable(get))
             assert(callable(set))
@@ -284,11 +545,90 @@ class GuiettaProperty:
             raise TypeError(errmsg) from e
 
         self.get = get
+        self.on_change = None
+        self.skipped = 0
+        self._last_key = None
         if add_decorators:
             gui = widget._gui
-            set = undo_context_manager(get)(execute_in_main_thread(gui)(set))
+            inner = self._notify_after(set)
+            if skip_unchanged:
+                inner = self._skip_unchanged(inner)
+            inner = self._defer_in_batch(gui, inner)
+            set = undo_context_manager(get)(execute_in_main_thread(gui)(inner))
         self.set = set
 
+    def invalidate(self):
+        '''Forget the last assigned value'''
+        self._last_key = None
+
+    def _notify_after(self, f):
+        '''Call the *on_change* callback, if any, after *f*'''
+        @wraps(f)
+        def wrapper(value):
+            f(value)
+            if self.on_change is not None:
+                self.on_change()
+        return wrapper
+
+    def _defer_in_batch(self, gui, f):
+        '''Postpone *f* until the end of a gui.batch() block, if any'''
+        @wraps(f)
+        def wrapper(value):
+            pending = gui.__dict__.get('_batch')
+            if pending is not None:
+                pending[self] = (f, value)   # Only the last value is kept
+            else:
+                f(value)
+        return wrapper
+
+    def _skip_unchanged(self, f):
+        '''Do not call *f* if the value is the same as the last one'''
+        @wraps(f)
+        def wrapper(value):
+            key = _value_key(value)
+            if key is not None and _same_key(key, self._last_key):
+                self.skipped += 1
+                return
+            self._last_key = None
+            f(value)
+            self._last_key = key
+        return wrapper
+
+
+_immutable_types = (str, bytes, int, float, complex, type(None))
+
+
+def _value_key(value):
+    '''Returns a cheap copy of *value* for change detection.
+
+    Scalars and strings are used as they are, sequences and mappings
+    are shallow-copied into tuples, and arrays are reduced to their
+    shape, type and hash. Returns None for values that cannot be
+    compared reliably.
+    '''
+    if isinstance(value, _immutable_types):
+        return (type(value), value)
+
+    if all(hasattr(value, x) for x in ('shape', 'dtype', 'tobytes')):
+        return (type(value), value.shape, str(value.dtype),
+                hash(value.tobytes()))
+
+    if isinstance(value, Mapping):
+        return (type(value), tuple(value.items()))
+
+    if isinstance(value, (list, tuple, range)):
+        return (type(value), tuple(value))
+
+    return None
+
+
+def _same_key(key1, key2):
+    '''Compare two keys from _value_key(), which may contain arrays'''
+    try:
+        return bool(key1 == key2)
+    except Exception:
+        return False
+
 
 class _ContextStr(str, ContextMixIn):
     def __new__(cls, widget, *args, **kw):
@@ -334,7 +674,7 @@ def _alsoAcceptAnotherGui(widget):
                 if isinstance(widget, QGroupBox):
                     widget.setLayout(value.layout())
                 else:
-                    widget._gui.layout().replaceWidget(widget, value.window())
+                    widget._gui._replace_widget(widget, value.window())
                     widget.hide()
                 widget._gui.add_as_subgui(value)
             else:
@@ -427,7 +767,7 @@ def _signal_property(widget):
     return GuiettaProperty(getx, setx, widget)
 
 
-def _text_property(widget):
+def _text_property(widget, skip_unchanged=True):
     '''Property for text-based widgets (labels, buttons)'''
 
     def get_text():
@@ -441,7 +781,8 @@ def _text_property(widget):
         else:
             widget.setText(str(text))
 
-    return GuiettaProperty(get_text, set_text, widget)
+    return GuiettaProperty(get_text, set_text, widget,
+                           skip_unchanged=skip_unchanged)
 
 
 def _setonly_text_property(widget):
@@ -453,7 +794,8 @@ def _setonly_text_property(widget):
     def get():
         return widget
 
-    prop = _text_property(widget)
+    # Never skip assignments, since the widget may change its own text
+    prop = _text_property(widget, skip_unchanged=False)
     prop.get = get
     return prop
 
@@ -469,7 +811,7 @@ def _title_property(widget):
     def set_title(title):
         widget.setTitle(str(title))
 
-    return GuiettaProperty(get_title, set_title, widget)
+    return GuiettaProperty(get_title, set_title, widget, skip_unchanged=True)
 
 
 def _value_property(widget, typ):
@@ -486,7 +828,7 @@ def _value_property(widget, typ):
     def set_value(value):
         widget.setValue(typ(value))
 
-    return GuiettaProperty(get_value, set_value, widget)
+    return GuiettaProperty(get_value, set_value, widget, skip_unchanged=True)
 
 
 def _readonly_property(widget):
@@ -502,8 +844,164 @@ def _readonly_property(widget):
     return GuiettaProperty(getx, setx, widget)
 
 
+# Above this size, list assignments do not look for the minimum
+# set of changes, since the diff algorithm is quadratic in the worst case.
+_max_diff_work = 10**7
+
+
+def _apply_diff(old, new, replace, insert, remove, same=None):
+    '''Transform the *old* list into the *new* one with few operations.
+
+    Instead of building a new list, calls:
+
+        - replace(i, j): set row i to new[j]
+        - insert(i, j1, j2): insert new[j1:j2] before row i
+        - remove(i, n): remove n rows starting at row i
+        - same(i, j): row i already has the same value as new[j]
+          (optional, used for rows that did not change)
+
+    Changes are applied from the end of the list, so that
+    row indexes are always valid when the callbacks are called.
+    '''
+    if old == new and same is None:
+        return
+
+    # Fast path for the common head and tail (e.g. appends)
+    nmin = min(len(old), len(new))
+    head = 0
+    while head < nmin and old[head] == new[head]:
+        head += 1
+    tail = 0
+    while tail < nmin - head and old[-1 - tail] == new[-1 - tail]:
+        tail += 1
+
+    old_mid = old[head:len(old) - tail]
+    new_mid = new[head:len(new) - tail]
+
+    if len(old_mid) * len(new_mid) > _max_diff_work:
+        opcodes = [('replace', 0, len(old_mid), 0, len(new_mid))]
+    else:
+        matcher = difflib.SequenceMatcher(None, old_mid, new_mid,
+                                          autojunk=False)
+        opcodes = matcher.get_opcodes()
+
+    opcodes = [(tag, i1 + head, i2 + head, j1 + head, j2 + head)
+               for tag, i1, i2, j1, j2 in opcodes]
+    opcodes.insert(0, ('equal', 0, head, 0, head))
+    opcodes.append(('equal', len(old) - tail, len(old),
+                    len(new) - tail, len(new)))
+
+    for tag, i1, i2, j1, j2 in reversed(opcodes):
+        if tag == 'equal':
+            if same is not None:
+                for k in range(i2 - i1):
+                    same(i1 + k, j1 + k)
+            continue
+        n = min(i2 - i1, j2 - j1)
+        for k in range(n):
+            replace(i1 + k, j1 + k)
+        if i2 - i1 > n:
+            remove(i1 + n, i2 - i1 - n)
+        if j2 - j1 > n:
+            insert(i1 + n, j1 + n, j2)
+
+
+class _ItemsCache:
+    '''Cached copy of the items of a model-based widget.
+
+    *read* is a function that reads the items from the widget. The cache
+    is dropped when the widget model changes, unless the change
+    is done inside an *updating()* block.
+    '''
+
+    def __init__(self, widget, read):
+        self._widget = widget
+        self._read = read
+        self._items = None
+        self._updating = False
+        model = widget.model()
+        for signal in (model.rowsInserted, model.rowsRemoved,
+                       model.rowsMoved, model.dataChanged,
+                       model.modelReset, model.layoutChanged):
+            signal.connect(self._invalidate)
+
+    @classmethod
+    def of(cls, widget, read):
+        '''Return the cache of *widget*, creating it if needed'''
+        if not hasattr(widget, '_guietta_items_cache'):
+            widget._guietta_items_cache = cls(widget, read)
+        return widget._guietta_items_cache
+
+    def _invalidate(self, *args):
+        if not self._updating:
+            self._items = None
+
+    def get(self):
+        if self._items is None:
+            self._items = self._read(self._widget)
+        return self._items
+
+    @contextlib.contextmanager
+    def updating(self, new_items):
+        '''Context manager for changes that will result in *new_items*'''
+        self._updating = True
+        try:
+            yield
+        except Exception:
+            self._items = None
+            raise
+        else:
+            self._items = new_items
+        finally:
+            self._updating = False
+
+
+def _read_list_widget(widget):
+    return [widget.item(i).text() for i in range(widget.count())]
+
+
 def _items_property(widget):
-    '''Property for widgets with string lists'''
+    '''Property for widgets with string lists
+
+    Assignments only modify the rows that changed.
+    '''
+    if not isinstance(widget, QListWidget):
+        return _generic_items_property(widget)
+
+    cache = _ItemsCache.of(widget, _read_list_widget)
+
+    def get_items():
+        return _ContextList(widget, cache.get())
+
+    @_alsoAcceptAnotherGui(widget)
+    def set_items(lst):
+        old = cache.get()
+        new = list(map(str, lst))
+
+        def replace(i, j):
+            widget.item(i).setText(new[j])
+
+        def insert(i, j1, j2):
+            widget.insertItems(i, new[j1:j2])
+
+        def remove(i, n):
+            widget.model().removeRows(i, n)
+
+        with cache.updating(new):
+            _apply_diff(old, new, replace, insert, remove)
+
+    def extend(lst):
+        new = list(map(str, lst))
+        with cache.updating(cache.get() + new):
+            widget.addItems(new)
+
+    prop = GuiettaProperty(get_items, set_items, widget)
+    prop.extend = extend
+    return prop
+
+
+def _generic_items_property(widget):
+    '''Property for item views other than QListWidget'''
 
     def get_items():
         items = map(lambda x: x.text(), widget.findItems("*", Qt.MatchWildcard))
@@ -518,26 +1016,99 @@ def _items_property(widget):
     return GuiettaProperty(get_items, set_items, widget)
 
 
+def _read_combobox(widget):
+    texts = [widget.itemText(i) for i in range(widget.count())]
+    data = [widget.itemData(i) for i in range(widget.count())]
+    return texts, data
+
+
 def _combobox_property(widget):
-    '''Property for comboboxes'''
+    '''Property for comboboxes
+
+    Assignments only modify the entries that changed.
+    '''
+    if isinstance(widget.model(), _ComboBoxModel):
+        return _combobox_model_property(widget)
+
+    cache = _ItemsCache.of(widget, _read_combobox)
 
     def get_items():
-        texts = [widget.itemText(i) for i in range(widget.count())]
-        data = [widget.itemData(i) for i in range(widget.count())]
+        texts, data = cache.get()
         return _ContextDict(widget, zip(texts, data))
 
     @_alsoAcceptAnotherGui(widget)
     def set_items(dct):
-        widget.clear()
-        for k, v in dct.items():
-            widget.addItem(k, v)
+        old_texts, old_data = cache.get()
+        new_texts = list(dct.keys())
+        new_data = list(dct.values())
+
+        def replace(i, j):
+            widget.setItemText(i, new_texts[j])
+            widget.setItemData(i, new_data[j])
+
+        def insert(i, j1, j2):
+            for k in range(j1, j2):
+                widget.insertItem(i + k - j1, new_texts[k], new_data[k])
+
+        def remove(i, n):
+            for k in range(n):
+                widget.removeItem(i)
+
+        def same(i, j):
+            try:
+                changed = bool(old_data[i] != new_data[j])
+            except Exception:
+                changed = True
+            if changed:
+                widget.setItemData(i, new_data[j])
+
+        with cache.updating((new_texts, new_data)):
+            _apply_diff(old_texts, new_texts, replace, insert, remove, same)
+
+    def extend(items):
+        if not isinstance(items, Mapping):
+            items = dict.fromkeys(items)
+        texts, data = cache.get()
+        with cache.updating((texts + list(items.keys()),
+                             data + list(items.values()))):
+            for k, v in items.items():
+                widget.addItem(k, v)
+
+    prop = GuiettaProperty(get_items, set_items, widget)
+    prop.extend = extend
+    return prop
 
-    return GuiettaProperty(get_items, set_items, widget)
+
+def _combobox_model_property(widget):
+    '''Property for comboboxes created by CB, backed by a _ComboBoxModel'''
+
+    model = widget.model()
+
+    def get_items():
+        return _ContextDict(widget, model.as_dict())
+
+    @_alsoAcceptAnotherGui(widget)
+    def set_items(dct):
+        current = widget.currentText()
+        model.set_items(list(dct.keys()), list(dct.values()))
+        index = model.find(current)
+        if index < 0 and model.rowCount() > 0:
+            index = 0
+        widget.setCurrentIndex(index)
+
+    def extend(items):
+        if not isinstance(items, Mapping):
+            items = dict.fromkeys(items)
+        model.extend(list(items.keys()), list(items.values()))
+
+    prop = GuiettaProperty(get_items, set_items, widget)
+    prop.extend = extend
+    return prop
 
 
 #########
 
-class SmartQLabel(QWidget):
+class SmartQLabel(QWidget, ContextMixIn):
     '''A smarter QLabel that accepts strings, lists and dicts.
 
     Internally it's a QHBoxLayout with two labels. The right label is
@@ -629,27 +1200,40 @@ class HeartBeat(SmartQLabel):
         return _setonly_text_property(self)
 
 
-class Led(QLabel):
+class Led(QLabel, ContextMixIn):
     '''Led class
 
     A label that changes foreground color between two possible values,
     initialized by default with a small square with the foreground color.
     Can be assigned a boolean to switch state.
+
+    The two colors are stored as palettes built once, so that switching
+    state does not trigger a style sheet recomputation.
     '''
     def __init__(self, offcolor='red', oncolor='green', text='<html>&#9635;</html>'):
         self._offcolor = offcolor
         self._oncolor = oncolor
         self._state = None
         super().__init__(text)
+        self._palettes = {False: self._make_palette(offcolor),
+                          True: self._make_palette(oncolor)}
         self.off()
 
+    def _make_palette(self, color):
+        palette = QPalette(self.palette())
+        palette.setColor(QPalette.WindowText, QColor(color))
+        return palette
+
+    def _set_state(self, state):
+        if state is not self._state:
+            self.setPalette(self._palettes[state])
+            self._state = state
+
     def on(self):
-        self.setStyleSheet('QLabel { color: '+self._oncolor+' }')
-        self._state = True
+        self._set_state(True)
 
     def off(self):
-        self.setStyleSheet('QLabel { color: '+self._offcolor+' }')
-        self._state = False
+        self._set_state(False)
 
     def __guietta_property__(self):
 
@@ -665,29 +1249,104 @@ class Led(QLabel):
         return GuiettaProperty(get_state, set_state, self)
 
 
-def _guietta_property(widget):
-    '''Create the instance property corresponding to `widget`'''
+class _LedMatrix(QWidget, ContextMixIn):
+    '''A grid of status cells painted in a single paintEvent
 
-    if isinstance(widget, QAbstractButton):
-        return _signal_property(widget)
+    The state is a NumPy integer array, and each value is an index
+    into the *colors* list. Boolean arrays use the first color
+    for False and the second one for True.
+    '''
 
-    elif isinstance(widget, (QLabel, QLineEdit, SmartQLabel)):
-        return _text_property(widget)
+    def __init__(self, shape, colors=('red', 'green'), cell_size=12,
+                 spacing=2):
+        import numpy as np
 
-    elif isinstance(widget, QGroupBox):
-        return _title_property(widget)
+        super().__init__()
+        if isinstance(shape, int):
+            shape = (1, shape)
+        self._state = np.zeros(shape, dtype=int)
+        self._colors = [QColor(c) for c in colors]
+        self._cell_size = cell_size
+        self._spacing = spacing
 
-    elif isinstance(widget, (QAbstractSlider, QProgressBar)):
-        return _value_property(widget, int)
+    @property
+    def shape(self):
+        return self._state.shape
+
+    def sizeHint(self):
+        rows, cols = self._state.shape
+        pitch = self._cell_size + self._spacing
+        return QSize(cols * pitch, rows * pitch)
+
+    def minimumSizeHint(self):
+        rows, cols = self._state.shape
+        return QSize(cols * (self._spacing + 1), rows * (self._spacing + 1))
+
+    def _pitch(self):
+        rows, cols = self._state.shape
+        return max(1, min(self.width() // cols, self.height() // rows))
+
+    def _cell_rect(self, row, col, pitch):
+        size = max(1, pitch - self._spacing)
+        return QRect(col * pitch, row * pitch, size, size)
+
+    def state(self):
+        '''Returns a copy of the state array'''
+        return self._state.copy()
+
+    def set_state(self, state):
+        '''Set a new state, repainting only the area that changed'''
+        import numpy as np
+
+        # Always copy, so that later in-place edits of the caller's
+        # array are detected at the next assignment
+        state = np.array(state, dtype=int, copy=True)
+        if state.size == self._state.size:
+            state = state.reshape(self._state.shape)
+        else:
+            raise ValueError('Expected %d values, got %d' %
+                             (self._state.size, state.size))
 
-    elif isinstance(widget, QAbstractItemView):
-        return _items_property(widget)
+        rows, cols = np.nonzero(state != self._state)
+        if len(rows) == 0:
+            return
+        self._state = state
 
-    elif isinstance(widget, QComboBox):
-        return _combobox_property(widget)
+        pitch = self._pitch()
+        top_left = self._cell_rect(rows.min(), cols.min(), pitch)
+        bottom_right = self._cell_rect(rows.max(), cols.max(), pitch)
+        self.update(top_left.united(bottom_right))
+
+    def paintEvent(self, event):
+        import numpy as np
+
+        pitch = self._pitch()
+        exposed = event.rect()
+        painter = QPainter(self)
+        try:
+            for value, color in enumerate(self._colors):
+                rows, cols = np.nonzero(self._state == value)
+                for row, col in zip(rows.tolist(), cols.tolist()):
+                    rect = self._cell_rect(row, col, pitch)
+                    if rect.intersects(exposed):
+                        painter.fillRect(rect, color)
+        finally:
+            painter.end()
+
+    def __guietta_property__(self):
+
+        @_alsoAcceptAnotherGui(self)
+        def set_state(state):
+            self.set_state(state)
+
+        return GuiettaProperty(self.state, set_state, self)
 
-    else:
-        return _readonly_property(widget)
+
+def _guietta_property(widget):
+    '''Create the instance property corresponding to `widget`'''
+
+    factory = _property_factories.lookup(type(widget), _readonly_property)
+    return factory(widget)
 
 
 ########
@@ -816,21 +1475,88 @@ class R9(_R):
     _group = 9
 
 
+class _ImageIndex:
+    '''Index of the image files in a directory
+
+    The directory is listed once, keeping only the files with an
+    image extension. Strings without an image extension are never
+    looked up on the filesystem. Image filenames missing from the index
+    are checked with os.path.exists() and added if found, so that files
+    created later are still picked up. If watched, the index is rebuilt
+    when the directory contents change.
+    '''
+
+    _extensions = None
+
+    def __init__(self, directory):
+        self.directory = directory
+        self._watcher = None
+        self.refresh()
+
+    @classmethod
+    def is_image_name(cls, filename):
+        if cls._extensions is None:
+            formats = QImageReader.supportedImageFormats()
+            cls._extensions = {'.' + f.data().decode().lower()
+                               for f in formats}
+        _, ext = os.path.splitext(filename)
+        return ext.lower() in cls._extensions
+
+    def refresh(self, *args):
+        '''Lists the directory again'''
+        try:
+            with os.scandir(self.directory) as it:
+                self._files = {entry.name for entry in it
+                               if self.is_image_name(entry.name)}
+        except OSError:
+            self._files = set()
+
+    def watch(self):
+        '''Refresh the index whenever the directory changes'''
+        if self._watcher is None:
+            self._watcher = QFileSystemWatcher([self.directory])
+            self._watcher.directoryChanged.connect(self.refresh)
+
+    def fullpath(self, filename):
+        '''Returns the full image path if it exists, otherwise None'''
+        if not self.is_image_name(filename):
+            return None
+        if filename in self._files:
+            return os.path.join(self.directory, filename)
+
+        fullpath = os.path.join(self.directory, filename)
+        if os.path.exists(fullpath):
+            if os.path.dirname(filename) == '':
+                self._files.add(filename)
+            return fullpath
+        return None
+
+
+_image_indexes = {}
+
+
+def _image_index(directory):
+    '''Returns the shared _ImageIndex for `directory`'''
+    directory = os.path.abspath(directory)
+    try:
+        return _image_indexes[directory]
+    except KeyError:
+        index = _image_indexes[directory] = _ImageIndex(directory)
+        return index
+
+
 def _image_fullpath(gui, filename):
     '''Returns the full image path if the filename is valid, otherwise None'''
 
-    if not os.path.isabs(filename):
-        fullpath = os.path.join(gui.images_dir, filename)
-    else:
-        fullpath = filename
-
     name, _ = os.path.splitext(filename)
 
-    if os.path.exists(fullpath):
-        return fullpath, name
-    else:
+    if os.path.isabs(filename):
+        if _ImageIndex.is_image_name(filename) and os.path.exists(filename):
+            return filename, name
         return None, name
 
+    return _image_index(gui.images_dir).fullpath(filename), name
+
 
 class L(_DeferredCreationWidget):
     '''Text label or image label'''
@@ -954,7 +1680,7 @@ class VSeparator(_Separator):
 #################
 # List box
 
-class _QListWidgetWithDropSignal(QListWidget):
+class _QListWidgetWithDropSignal(QListWidget, ContextMixIn):
     '''A QListWidget that emits a signal when something is dropped on it.'''
 
     drop = Signal()
@@ -964,37 +1690,317 @@ class _QListWidgetWithDropSignal(QListWidget):
         self.drop.emit()
 
 
+class _SequenceListModel(QAbstractListModel):
+    '''Read-only list model over any Python sequence or NumPy array.
+
+    Items are converted to strings only when QT asks for them,
+    that is, only for the visible rows.
+    '''
+
+    def __init__(self, seq=()):
+        super().__init__()
+        self._seq = seq
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._seq)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            return str(self._seq[index.row()])
+        return None
+
+    def sequence(self):
+        return self._seq
+
+    def set_sequence(self, seq):
+        self.beginResetModel()
+        self._seq = seq
+        self.endResetModel()
+
+    def extend(self, items):
+        items = list(items)
+        n = len(self._seq)
+        self.beginInsertRows(QModelIndex(), n, n + len(items) - 1)
+        if _mutable_sequence(self._seq):
+            self._seq.extend(items)
+        else:
+            self._seq = list(self._seq) + items
+        self.endInsertRows()
+
+
+class _VirtualListView(QListView, ContextMixIn):
+    '''A QListView showing a _SequenceListModel.
+
+    Emits currentTextChanged like QListWidget. The guietta property
+    reads and writes the underlying sequence, without copying it.
+    '''
+
+    currentTextChanged = Signal(str)
+
+    def __init__(self):
+        super().__init__()
+        self.setUniformItemSizes(True)   # Avoid measuring every row
+        self.setModel(_SequenceListModel())
+        self.selectionModel().currentChanged.connect(self._current_changed)
+
+    def _current_changed(self, current, previous):
+        text = current.data() if current.isValid() else ''
+        self.currentTextChanged.emit(text)
+
+    def __guietta_property__(self):
+
+        def get_items():
+            return self.model().sequence()
+
+        @_alsoAcceptAnotherGui(self)
+        def set_items(seq):
+            self.model().set_sequence(seq)
+
+        prop = GuiettaProperty(get_items, set_items, self)
+        prop.extend = self.model().extend
+        return prop
+
+
 class LB(_DeferredCreationWidget):
-    '''Listbox'''
+    '''Listbox
+
+    With *virtual* set to True, the listbox keeps a reference to the
+    assigned sequence (for example a list or a NumPy array) instead of
+    copying its elements into QT items, and only converts the
+    visible rows to strings. Reading the property returns
+    the same sequence.
+    '''
+
+    def __init__(self, name, virtual=False):
+        self._name = name
+        self._virtual = virtual
 
     def create(self, gui):
+        if self._virtual:
+            return (_VirtualListView(), self._name)
         return (_QListWidgetWithDropSignal(), self._name)
 
 
 #######################
 # Combobox
 
+class _ComboBoxModel(QAbstractListModel):
+    '''List model holding combobox texts and data in two Python lists.
+
+    The content can be replaced with row insert, remove and change
+    notifications for the rows that changed, or extended with a single
+    notification, instead of one per item. The usual QComboBox
+    methods like addItem() and removeItem() keep working.
+    '''
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._texts = []
+        self._data = []
+        self._dict = None        # Cached dictionary for the property
+        self._index = None       # Cached text -> row mapping
+        self._prefix_index = None
+
+    def _changed(self):
+        self._dict = None
+        self._index = None
+        self._prefix_index = None
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._texts)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            return self._texts[index.row()]
+        if role == Qt.UserRole:
+            return self._data[index.row()]
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid():
+            return False
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            self._texts[index.row()] = value
+        elif role == Qt.UserRole:
+            self._data[index.row()] = value
+        else:
+            return False
+        self._changed()
+        self.dataChanged.emit(index, index)
+        return True
+
+    def flags(self, index):
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def insertRows(self, row, count, parent=QModelIndex()):
+        self.beginInsertRows(parent, row, row + count - 1)
+        self._texts[row:row] = [''] * count
+        self._data[row:row] = [None] * count
+        self._changed()
+        self.endInsertRows()
+        return True
+
+    def removeRows(self, row, count, parent=QModelIndex()):
+        self.beginRemoveRows(parent, row, row + count - 1)
+        del self._texts[row:row + count]
+        del self._data[row:row + count]
+        self._changed()
+        self.endRemoveRows()
+        return True
+
+    def set_items(self, texts, data):
+        '''Replace the content, notifying only the rows that changed'''
+        texts = [str(x) for x in texts]
+        data = list(data)
+        changed = []    # First and last row of a pending dataChanged
+
+        def flush():
+            if changed:
+                self.dataChanged.emit(self.index(changed[0]),
+                                      self.index(changed[1]))
+                changed.clear()
+
+        def mark(i):
+            if changed and changed[1] == i - 1:
+                changed[1] = i
+            else:
+                flush()
+                changed[:] = [i, i]
+
+        def replace(i, j):
+            self._texts[i] = texts[j]
+            self._data[i] = data[j]
+            mark(i)
+
+        def insert(i, j1, j2):
+            flush()
+            self.beginInsertRows(QModelIndex(), i, i + j2 - j1 - 1)
+            self._texts[i:i] = texts[j1:j2]
+            self._data[i:i] = data[j1:j2]
+            self.endInsertRows()
+
+        def remove(i, n):
+            flush()
+            self.beginRemoveRows(QModelIndex(), i, i + n - 1)
+            del self._texts[i:i + n]
+            del self._data[i:i + n]
+            self.endRemoveRows()
+
+        def same(i, j):
+            try:
+                different = bool(self._data[i] != data[j])
+            except Exception:
+                different = True
+            if different:
+                self._data[i] = data[j]
+                mark(i)
+
+        self._changed()
+        _apply_diff(self._texts, texts, replace, insert, remove, same)
+        flush()
+        self._changed()
+
+    def extend(self, texts, data):
+        n = len(self._texts)
+        self.beginInsertRows(QModelIndex(), n, n + len(texts) - 1)
+        self._texts.extend(str(x) for x in texts)
+        self._data.extend(data)
+        self._changed()
+        self.endInsertRows()
+
+    def as_dict(self):
+        if self._dict is None:
+            self._dict = dict(zip(self._texts, self._data))
+        return self._dict
+
+    def find(self, text):
+        '''Row of the first item with *text*, or -1'''
+        if self._index is None:
+            self._index = {}
+            for row, t in enumerate(self._texts):
+                self._index.setdefault(t, row)
+        return self._index.get(text, -1)
+
+    def starting_with(self, prefix, max_matches):
+        '''Up to *max_matches* texts starting with *prefix*, ignoring case'''
+        if self._prefix_index is None:
+            self._prefix_index = sorted((t.lower(), t) for t in self._texts)
+        prefix = prefix.lower()
+        start = bisect.bisect_left(self._prefix_index, (prefix,))
+        matches = []
+        for key, text in self._prefix_index[start:start + max_matches]:
+            if not key.startswith(prefix):
+                break
+            matches.append(text)
+        return matches
+
+
+class _PrefixCompleter(QCompleter):
+    '''Type-ahead completer for comboboxes using a _ComboBoxModel.
+
+    Matches are found with a binary search in a sorted index,
+    and only the first *max_matches* are shown.
+    '''
+
+    max_matches = 100
+
+    def __init__(self, combobox):
+        self._matches = QStringListModel()
+        super().__init__(self._matches, combobox)
+        self._combobox = combobox
+        self.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        combobox.lineEdit().textEdited.connect(self._update)
+
+    def _update(self, text):
+        model = self._combobox.model()
+        self._matches.setStringList(model.starting_with(text, self.max_matches))
+        if text:
+            self.complete()
+
+
 class CB(_DeferredCreationWidget):
-    '''Combobox'''
+    '''Combobox
+
+    Set *searchable* to True to make the combobox editable, with a popup
+    that shows the entries starting with the typed text.
+    '''
 
-    def __init__(self, name, list_or_dict):
+    def __init__(self, name, list_or_dict, searchable=False):
         self._name = name
         self._list_or_dict = list_or_dict
+        self._searchable = searchable
 
     def create(self, gui):
 
         cb = QComboBox()
+        model = _ComboBoxModel(cb)
+        cb.setModel(model)
+
+        # Make editable while still empty, since the default
+        # completer installed by setEditable() scans the whole model.
+        if self._searchable:
+            cb.setEditable(True)
+            cb.setInsertPolicy(QComboBox.NoInsert)
+            cb.setCompleter(_PrefixCompleter(cb))
+
         if isinstance(self._list_or_dict, Mapping):
-            for k, v in self._list_or_dict.items():
-                cb.addItem(k, v)
+            model.set_items(self._list_or_dict.keys(),
+                            self._list_or_dict.values())
 
         elif _sequence(self._list_or_dict):
-            for v in self._list_or_dict:
-                cb.addItem(v, None)
+            model.set_items(self._list_or_dict,
+                            [None] * len(self._list_or_dict))
         else:
             raise TypeError('ComboBox initializer must be either a sequence '
                             'or a mapping')
 
+        cb.setCurrentIndex(0 if model.rowCount() > 0 else -1)
         return (cb, self._name)
 
 
@@ -1137,27 +2143,305 @@ class VValueSlider(_ValueSlider):
         super().__init__(Qt.Vertical, name, anchor, myrange, unit, default)
 
 
+#################
+# Widget banks
+
+class _WidgetBank(QWidget, ContextMixIn):
+    '''A grid of identical widgets whose values are read and written
+    as a single array.
+
+    Values are kept in a flat list, updated when the user moves a slider,
+    so that reading does not query every widget. Assignments only touch
+    the widgets whose value changed. The *changed* signal is emitted
+    once per assignment or user change.
+    '''
+
+    changed = Signal()
+
+    def __init__(self, kind, shape):
+        super().__init__()
+        if isinstance(shape, int):
+            shape = (1, shape)
+        if kind not in _bank_kinds:
+            raise TypeError('Unsupported widget bank type: %s' % kind)
+
+        create, self._setter, signal_name = _bank_kinds[kind]
+        self.shape = tuple(shape)
+        self.widgets = []
+        self._updating = False
+
+        layout = QGridLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        for i in range(shape[0]):
+            for j in range(shape[1]):
+                widget = create()
+                layout.addWidget(widget, i, j)
+                if signal_name is not None:
+                    handler = functools.partial(self._widget_changed,
+                                                len(self.widgets))
+                    getattr(widget, signal_name).connect(handler)
+                self.widgets.append(widget)
+        self.setLayout(layout)
+
+        self._values = [_bank_widget_value(w) for w in self.widgets]
+
+    def _widget_changed(self, i, value):
+        self._values[i] = value
+        if not self._updating:
+            self.changed.emit()
+
+    def values(self):
+        '''Returns a copy of the values, as a NumPy array if available'''
+        try:
+            import numpy as np
+        except ImportError:
+            return list(self._values)
+        return np.array(self._values).reshape(self.shape)
+
+    def set_values(self, values):
+        '''Assign new values, touching only the widgets that changed'''
+        changed = None
+        try:
+            import numpy as np
+        except ImportError:
+            new = list(_flatten(values))
+        else:
+            new_array = np.asarray(values).ravel()
+            old_array = np.asarray(self._values)
+            # Vectorized comparison only when no value needs a conversion
+            if (new_array.size == old_array.size and
+                    new_array.dtype.kind in 'biuf' and
+                    old_array.dtype.kind in 'biuf'):
+                changed = np.flatnonzero(new_array != old_array).tolist()
+            new = new_array.tolist()
+
+        if len(new) != len(self._values):
+            raise ValueError('Expected %d values, got %d' %
+                             (len(self._values), len(new)))
+
+        if changed is None:
+            changed = [i for i, (a, b) in enumerate(zip(new, self._values))
+                       if a != b]
+
+        # Cache what the widget holds after conversion and clamping,
+        # which can differ from the assigned value
+        modified = False
+        self._updating = True
+        try:
+            for i in changed:
+                widget = self.widgets[i]
+                self._setter(widget, new[i])
+                value = _bank_widget_value(widget)
+                if value != self._values[i]:
+                    self._values[i] = value
+                    modified = True
+        finally:
+            self._updating = False
+        if modified:
+            self.changed.emit()
+
+    def __guietta_property__(self):
+
+        @_alsoAcceptAnotherGui(self)
+        def set_values(values):
+            self.set_values(values)
+
+        return GuiettaProperty(self.values, set_values, self)
+
+
+def _flatten(x):
+    if _sequence(x):
+        for element in x:
+            yield from _flatten(element)
+    else:
+        yield x
+
+
+def _bank_widget_value(widget):
+    if isinstance(widget, Led):
+        return widget._state
+    elif isinstance(widget, QLabel):
+        return widget.text()
+    else:
+        return widget.value()
+
+
+def _set_led(widget, value):
+    if value:
+        widget.on()
+    else:
+        widget.off()
+
+
+def _new_progress_bar():
+    widget = QProgressBar()
+    widget.setValue(0)
+    return widget
+
+
+# For each supported type: widget factory, value setter, change signal
+_bank_kinds = {
+    HS: (lambda: QSlider(Qt.Horizontal), lambda w, v: w.setValue(int(v)),
+         'valueChanged'),
+    VS: (lambda: QSlider(Qt.Vertical), lambda w, v: w.setValue(int(v)),
+         'valueChanged'),
+    P: (_new_progress_bar, lambda w, v: w.setValue(int(v)), None),
+    Led: (Led, _set_led, None),
+    L: (lambda: QLabel(''), lambda w, v: w.setText(str(v)), None),
+}
+
+
+class WB(_DeferredCreationWidget):
+    '''Widget bank: a grid of sliders, progress bars, Leds or labels.
+
+    *kind* is one of HS, VS, P, Led or L, and *shape* is either
+    the number of widgets in a single row, or a (rows, columns) tuple.
+    The property reads and writes all values at once as a NumPy array
+    with the same shape (a flat list if NumPy is not installed).
+    Individual widgets are in the *widgets* attribute of the bank.
+    '''
+
+    def __init__(self, name, kind, shape):
+        self._name = name
+        self._kind = kind
+        self._shape = shape
+
+    def create(self, gui):
+        return (_WidgetBank(self._kind, self._shape), self._name)
+
+
+class LM(_DeferredCreationWidget):
+    '''Led matrix: a grid of status cells.
+
+    *shape* is either the number of cells in a single row,
+    or a (rows, columns) tuple. The property reads and writes
+    a NumPy integer array whose values index the *colors* list.
+    Requires numpy.
+    '''
+
+    def __init__(self, name, shape, colors=('red', 'green'), cell_size=12):
+        self._name = name
+        self._shape = shape
+        self._colors = colors
+        self._cell_size = cell_size
+
+    def create(self, gui):
+        widget = _LedMatrix(self._shape, self._colors, self._cell_size)
+        return (widget, self._name)
+
+
 #########
 # Signals
 
-_default_signals = {QPushButton: 'clicked',
+class _TypeRegistry:
+    '''Maps widget classes to values.
+
+    Lookups walk the MRO of the widget class, so that the most derived
+    registered class wins, and the result is cached for each class.
+    '''
+
+    _missing = object()
+
+    def __init__(self, entries):
+        self._entries = dict(entries)
+        self._cache = {}
+
+    def register(self, widget_class, value):
+        self._entries[widget_class] = value
+        self._cache.clear()
+
+    def lookup(self, widget_class, default=None):
+        # Classes mixed in by ContextMixIn resolve like the original one
+        widget_class = widget_class.__dict__.get('_context_base', widget_class)
+        try:
+            value = self._cache[widget_class]
+        except KeyError:
+            for base_class in widget_class.__mro__:
+                if base_class in self._entries:
+                    value = self._entries[base_class]
+                    break
+            else:
+                value = self._missing
+            self._cache[widget_class] = value
+
+        if value is self._missing:
+            return default
+        return value
+
+
+_property_factories = _TypeRegistry({
+                    QAbstractButton: _signal_property,
+                    QLabel: _text_property,
+                    QLineEdit: _text_property,
+                    SmartQLabel: _text_property,
+                    QGroupBox: _title_property,
+                    QAbstractSlider: lambda w: _value_property(w, int),
+                    QProgressBar: lambda w: _value_property(w, int),
+                    QAbstractItemView: _items_property,
+                    QComboBox: _combobox_property})
+
+_default_signals = _TypeRegistry({
+                    QPushButton: 'clicked',
                     QLineEdit: 'returnPressed',
                     QCheckBox: 'stateChanged',
                     QRadioButton: 'toggled',
                     QAbstractSlider: 'valueChanged',
                     QListWidget: 'currentTextChanged',
+                    _VirtualListView: 'currentTextChanged',
                     QGroupBox: 'clicked',
-                    QComboBox: 'currentTextChanged'}
+                    QComboBox: 'currentTextChanged',
+                    QTabWidget: 'currentChanged',
+                    _WidgetBank: 'changed'})
+
+# Signals emitted when the user changes a widget value. Used to keep
+# the value mirror up to date. Widgets not listed here are only modified
+# by property assignments.
+
+_change_signals = _TypeRegistry({
+                    QAbstractButton: 'toggled',
+                    QGroupBox: 'toggled',
+                    QComboBox: 'currentIndexChanged',
+                    QLineEdit: 'textChanged',
+                    QAbstractSlider: 'valueChanged',
+                    QProgressBar: 'valueChanged',
+                    _QListWidgetWithDropSignal: 'drop',
+                    QTabWidget: 'currentChanged',
+                    _WidgetBank: 'changed'})
+
+
+def register_widget_type(widget_class, property=None, default_signal=None,
+                         change_signal=None):
+    '''Register how Guietta handles instances of *widget_class*.
+
+    *property* is a function that receives a widget and returns a
+    GuiettaProperty for it, *default_signal* the name of the signal used
+    by events(), connect() and auto, and *change_signal* the name of the
+    signal emitted when the user modifies the widget value, used by
+    observe() and by property reads from other threads. Arguments left
+    to None are not changed. Subclasses of *widget_class* are handled
+    in the same way, unless registered themselves.
+    '''
+    if property is not None:
+        _property_factories.register(widget_class, property)
+    if default_signal is not None:
+        _default_signals.register(widget_class, default_signal)
+    if change_signal is not None:
+        _change_signals.register(widget_class, change_signal)
 
 
 def _default_signal_lookup(widget):
     '''Looks up the default signal for a widget that may be a derived class'''
 
-    for base_class, signal_name in _default_signals.items():
-        if isinstance(widget, base_class):
-            return signal_name
-    else:
+    signal_name = _default_signals.lookup(type(widget))
+    if signal_name is None:
         raise KeyError(widget.__class__.__name__)
+    return signal_name
+
+
+def _change_signal_lookup(widget):
+    '''Looks up the value change signal for a widget, or None'''
+
+    return _change_signals.lookup(type(widget))
 
 
 Event = namedtuple('Event', 'signal args')
@@ -1218,23 +2502,131 @@ def _exception_wrapper(func, gui):
     Wraps *func* with the default exception handler, based
     on the exception mode set by *gui* at the moment of handling.
     '''
+    name = _slot_name(func)
+
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
+        ident = threading.get_ident()
+        stack = _running_slots.setdefault(ident, [])
+        stack.append(name)
         try:
             func(*args, **kwargs)
         except Exception as e:
             _exception_handler(e, gui)
+        finally:
+            stack.pop()
+            # Do not keep an entry for every short-lived thread
+            if not stack:
+                _running_slots.pop(ident, None)
 
     return wrapper
 
 
-############
-# Matplotlib
+#################
+# Stall watchdog
 
-@contextlib.contextmanager
-def Ax(widget):
-    '''
-    Context manager to help drawing on Matplotlib widgets.
+# Names of the slots being executed, by thread id
+_running_slots = {}
+
+
+def _slot_name(func):
+    while isinstance(func, functools.partial):
+        func = func.func
+    return getattr(func, '__qualname__', repr(func))
+
+
+class StallError(Exception):
+    '''The main thread did not process events for *duration* seconds.
+
+    *slot* is the name of the slot that was running, if any, and *stack*
+    the main thread stack, formatted as a string, when the stall
+    was detected.
+    '''
+
+    def __init__(self, duration, slot, stack):
+        self.duration = duration
+        self.slot = slot
+        self.stack = stack
+        where = ' in slot %s' % slot if slot else ''
+        super().__init__('Event loop blocked for %.2f seconds%s\n%s' %
+                         (duration, where, stack))
+
+
+class Watchdog:
+    '''Detects when the main thread stops processing events.
+
+    A timer in the main thread records a heartbeat every *interval*
+    seconds, and a background thread checks it. When no heartbeat is
+    seen for more than *threshold* seconds, a StallError is built with the
+    main thread stack and the name of the running slot, and reported once
+    for each stall. If *callback* is given, it is called immediately from
+    the watchdog thread with the StallError. Otherwise, the error is passed
+    to the exception handler of the Gui after the main thread recovers.
+    Nothing is reported before the first heartbeat, that is, until the
+    event loop runs. The *stalls* list holds all errors reported so far.
+    '''
+
+    def __init__(self, gui, threshold=0.5, interval=None, callback=None):
+        if interval is None:
+            interval = threshold / 4
+        self.threshold = threshold
+        self.interval = interval
+        self.stalls = []
+        self._gui = gui
+        self._callback = callback
+        self._main_thread = gui._main_thread
+        self._last_beat = None            # Armed by the first heartbeat
+        self._reported_beat = None
+        self._stopped = threading.Event()
+
+        self._timer = QTimer()
+        self._timer.timeout.connect(self._beat)
+        self._timer.start(int(interval * 1000))
+        self._thread = threading.Thread(target=self._watch, daemon=True,
+                                        name='guietta-watchdog')
+        self._thread.start()
+
+    def _beat(self):
+        self._last_beat = time.monotonic()
+
+    def _watch(self):
+        while not self._stopped.wait(self.interval):
+            last_beat = self._last_beat
+            if last_beat is None:
+                continue
+            stalled = time.monotonic() - last_beat
+            if stalled > self.threshold and last_beat != self._reported_beat:
+                self._reported_beat = last_beat
+                self._report(self._capture(stalled))
+
+    def _capture(self, duration):
+        frame = sys._current_frames().get(self._main_thread)
+        stack = ''.join(traceback.format_stack(frame)) if frame else ''
+        slots = _running_slots.get(self._main_thread)
+        slot = slots[-1] if slots else None
+        return StallError(duration, slot, stack)
+
+    def _report(self, error):
+        self.stalls.append(error)
+        if self._callback is not None:
+            self._callback(error)
+        else:
+            _post_to_main_thread(_exception_handler, (error, self._gui))
+
+    def stop(self):
+        '''Stop the heartbeat and the watchdog thread'''
+        self._stopped.set()
+        self._timer.stop()
+        self._thread.join()
+
+
+############
+# Matplotlib
+
+@contextlib.contextmanager
+def Ax(widget):
+    '''
+    Context manager to help drawing on Matplotlib widgets.
 
     Takes care of clearing and redrawing the canvas before and after
     the inner code block is executed::
@@ -1291,8 +2683,6 @@ class M(_DeferredCreationWidget):
         from guietta import guietta_matplotlib
         widget_class = guietta_matplotlib.MatplotlibWidget
 
-        _default_signals[widget_class] = 'clicked'
-
         widget = widget_class(self._width, self._height, self._dpi,
                               self._subplots, self._animated, **self._kwargs)
         return (widget, self._name)
@@ -1343,10 +2733,31 @@ class PGI(_DeferredCreationWidget):
         return (widget, self._name)
 
 
+class T(_DeferredCreationWidget):
+    '''A table showing a 2d array, a record array or a pandas DataFrame.
+
+    Only the visible cells are converted to strings, using *float_format*
+    for floating point columns. Clicking on a column header
+    sorts the table without moving the data.
+
+    Creating an object of this class will import the numpy module.'''
+
+    def __init__(self, name, float_format='%g'):
+        self._name = name
+        self._float_format = float_format
+
+    def create(self, gui):
+        from guietta import guietta_table
+        widget_class = guietta_table.TableWidget
+
+        widget = widget_class(self._float_format)
+        return (widget, self._name)
+
+
 #####################
 # Stdout redirection
 
-class StdoutLog(QPlainTextEdit):
+class StdoutLog(QPlainTextEdit, ContextMixIn):
     '''Log widget showing the stdout/stderr in the GUI
 
     By default, stdout/stderr is redirected just before
@@ -1695,11 +3106,172 @@ class SubGui(_DeferredCreationWidget):
         return groupbox
 
 
+class _LazySubGuiWidget(QWidget, ContextMixIn):
+    '''Placeholder that builds its sub-gui the first time it is shown'''
+
+    def __init__(self, factory, size_hint=None):
+        super().__init__()
+        self._factory = factory
+        self._size_hint = size_hint
+        self.subgui = None
+
+    def sizeHint(self):
+        if self.subgui is None and self._size_hint is not None:
+            return QSize(*self._size_hint)
+        return super().sizeHint()
+
+    def ensure_built(self):
+        '''Build the sub-gui if not done yet, and return it'''
+
+        if self.subgui is None:
+            subgui = self._factory()
+            if not isinstance(subgui, Gui):
+                raise TypeError('Lazy sub-gui factory must return a Gui')
+            self.subgui = subgui
+            self.setLayout(subgui.layout())
+            self.updateGeometry()
+
+            gui = getattr(self, '_gui', None)
+            if gui is not None:
+                gui.add_as_subgui(subgui)
+                if gui._setup_done:
+                    subgui._setup()
+        return self.subgui
+
+    def showEvent(self, event):
+        self.ensure_built()
+        super().showEvent(event)
+
+    def __guietta_property__(self):
+
+        def get():
+            return self.subgui
+
+        def set(value):
+            raise AttributeError('Lazy sub-gui properties are read-only')
+
+        return GuiettaProperty(get, set, self)
+
+
+class LazyGui(_DeferredCreationWidget):
+    '''Sub-gui built the first time it becomes visible.
+
+    *factory* is called without arguments and must return a Gui instance.
+    Until then, an empty placeholder is used, with a size hint of
+    *size_hint* (width, height) if given. The property returns the
+    sub-gui, or None if not built yet, while
+    gui.widgets[name].ensure_built() builds it if needed and returns it.
+    The default name is the factory function name.
+    '''
+
+    def __init__(self, factory, size_hint=None, name=None):
+        self._factory = factory
+        self._size_hint = size_hint
+        if name is None:
+            name = factory.__name__
+        self._name = name
+
+    def create(self, gui):
+        widget = _LazySubGuiWidget(self._factory, self._size_hint)
+        return (widget, self._name)
+
+
+class _TabsWidget(QTabWidget, ContextMixIn):
+    '''Tab widget whose pages are Gui instances, built lazily if needed'''
+
+    def __init__(self, pages, size_hint=None):
+        super().__init__()
+        if isinstance(pages, Mapping):
+            pages = pages.items()
+
+        self._pages = []    # Gui or _LazySubGuiWidget for each tab
+        for title, page in pages:
+            if isinstance(page, Gui):
+                widget = page.window()
+            elif isinstance(page, LazyGui):
+                widget = _LazySubGuiWidget(page._factory, page._size_hint)
+            elif callable(page):
+                widget = _LazySubGuiWidget(page, size_hint)
+            else:
+                raise TypeError('Tab pages must be Gui instances, LazyGui '
+                                'or functions returning a Gui')
+            self._pages.append(page if isinstance(page, Gui) else widget)
+            self.addTab(widget, title)
+
+    def page(self, index_or_title):
+        '''Returns the Gui of a page, building it if needed'''
+
+        if isinstance(index_or_title, str):
+            titles = [self.tabText(i) for i in range(self.count())]
+            index_or_title = titles.index(index_or_title)
+        page = self._pages[index_or_title]
+        if isinstance(page, _LazySubGuiWidget):
+            return page.ensure_built()
+        return page
+
+    def __guietta_property__(self):
+
+        def get():
+            return self.tabText(self.currentIndex())
+
+        def set(index_or_title):
+            if isinstance(index_or_title, str):
+                for i in range(self.count()):
+                    if self.tabText(i) == index_or_title:
+                        index_or_title = i
+                        break
+                else:
+                    raise ValueError('No tab named %s' % index_or_title)
+            self.setCurrentIndex(index_or_title)
+
+        return GuiettaProperty(get, set, self)
+
+
+class TABS(_DeferredCreationWidget):
+    '''Tab widget.
+
+    *pages* is a dictionary or a list of (title, page) tuples, where
+    each page is either a Gui, a LazyGui, or a function returning a Gui.
+    Functions are only called when their page is first shown, using
+    *size_hint* (width, height) for the empty pages until then.
+    The property reads and sets the title of the current tab,
+    and gui.widgets[name].page(title) returns the Gui of a page.
+    '''
+
+    def __init__(self, name, pages, size_hint=None):
+        self._name = name
+        self._pages = pages
+        self._size_hint = size_hint
+
+    def create(self, gui):
+        widget = _TabsWidget(self._pages, self._size_hint)
+        for page in widget._pages:
+            if isinstance(page, Gui):
+                gui.add_as_subgui(page)
+            else:
+                page._gui = gui
+        return (widget, self._name)
+
+
 class Stretch():
     def __init__(self, factor):
         self.factor = factor
 
 
+def _row_chunks(rows):
+    '''Split rows into groups that can be built independently,
+    cutting only before rows without III continuations.'''
+
+    chunk = []
+    for row in rows:
+        if chunk and III not in row:
+            yield chunk
+            chunk = []
+        chunk.append(row)
+    if chunk:
+        yield chunk
+
+
 def detect_and_remove_stretches(rows):
 
     col_stretches = {}
@@ -1739,49 +3311,803 @@ def detect_and_remove_stretches(rows):
 # to remain open even after the function that created them exits.
 
 
-_guis = []
+_guis = {}                                 # id -> persistent Gui
+_registry = weakref.WeakValueDictionary()  # id -> any living Gui
 
 
 def _add_to_persistence_list(gui):
-    _guis.append(gui)
+    _guis[id(gui)] = gui
 
 
 def _remove_from_persistence_list(gui):
-    try:
-        _guis.remove(gui)
-    except ValueError:   # Not found
-        pass
+    _guis.pop(id(gui), None)
+
+
+def live_guis():
+    '''Returns a list of all Gui instances that have not been
+    garbage collected or destroyed'''
+    return list(_registry.values())
 
 
 #######################
-# Async processing
+# Thread-safe value mirror
+# Worker threads must not call QT getters. Instead, they read a copy
+# of all property values that is refreshed by the main thread every time
+# a value changes.
 
-class _result_event(QEvent):
-    '''Event used for callback processing'''
+Snapshot = namedtuple('Snapshot', 'version values')
 
-    def __init__(self, code, callback, args):
-        QEvent.__init__(self, code)
+
+class _ValueMirror:
+    '''Lock-protected copy of the property values of a Gui.
+
+    Only the main thread writes into the mirror, while any thread can read.
+    Every update increments the version counter.
+    '''
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._values = {}
+        self._versions = {}
+        self.version = 0
+
+    def update(self, name, value):
+        with self._lock:
+            self.version += 1
+            self._values[name] = value
+            self._versions[name] = self.version
+
+    def remove(self, name):
+        with self._lock:
+            self._values.pop(name, None)
+            self._versions.pop(name, None)
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+            self._versions.clear()
+
+    def get(self, name):
+        with self._lock:
+            try:
+                return self._values[name]
+            except KeyError:
+                raise AttributeError(name) from None
+
+    def version_of(self, name):
+        with self._lock:
+            try:
+                return self._versions[name]
+            except KeyError:
+                raise AttributeError(name) from None
+
+    def snapshot(self):
+        with self._lock:
+            return Snapshot(self.version, dict(self._values))
+
+
+class Subscription:
+    '''Handle returned by gui.observe(). Call unsubscribe() to stop
+    receiving notifications.'''
+
+    def __init__(self, observers, names, callback):
+        self._observers = observers
+        self.names = names
         self.callback = callback
-        self.args = args
 
+    @property
+    def active(self):
+        return self in self._observers.subscriptions
+
+    def unsubscribe(self):
+        self._observers.remove(self)
+
+
+class _Observers:
+    '''Value change notifications for the properties of a Gui.
+
+    Changes are collected until the next event loop iteration, when
+    each subscription whose names changed is called once with the set
+    of changed names.
+
+    Values are compared only for observed names, and the comparison key
+    of the last value is kept, so that each change computes one key.
+    '''
+
+    def __init__(self, gui):
+        self._gui = gui
+        self.subscriptions = []
+        self._pending = set()
+        self._scheduled = False
+        self._keys = {}          # name -> (last value, its _value_key)
+
+    def add(self, names, callback):
+        subscription = Subscription(self, names, callback)
+        self.subscriptions.append(subscription)
+        return subscription
+
+    def remove(self, subscription):
+        try:
+            self.subscriptions.remove(subscription)
+        except ValueError:
+            pass
+
+    def wants(self, name):
+        '''True if any subscription observes property *name*'''
+        return any(subscription.names is None or name in subscription.names
+                   for subscription in self.subscriptions)
+
+    def changed(self, name, old, value):
+        '''Property *name* was set to *value*, replacing *old*'''
+
+        if not self.wants(name):
+            self._keys.pop(name, None)
+            return
+
+        # Immutable values are unchanged if they are the same object
+        if value is old and isinstance(value, _immutable_types):
+            return
+
+        last = self._keys.get(name)
+        if last is not None and last[0] is old:
+            old_key = last[1]
+        else:
+            old_key = _value_key(old)
+        new_key = _value_key(value)
+        self._keys[name] = (value, new_key)
+        if new_key is not None and _same_key(old_key, new_key):
+            return
+
+        self._pending.add(name)
+        if not self._scheduled:
+            self._scheduled = True
+            _post_to_main_thread(self.flush, ())
+
+    def flush(self):
+        self._scheduled = False
+        pending, self._pending = self._pending, set()
+
+        for subscription in list(self.subscriptions):
+            if subscription.names is None:
+                changed = pending
+            else:
+                changed = pending & subscription.names
+            if changed and subscription.active:
+                _exception_wrapper(subscription.callback, self._gui)(
+                                   self._gui, frozenset(changed))
+
+
+PoolStats = namedtuple('PoolStats',
+                       'created reused discarded pooled pooled_widgets')
+
+
+class _PoolEntry:
+    '''State of a pooled Gui just after its creation'''
+
+    def __init__(self, gui):
+        values = gui.snapshot().values
+        self.values = {name: value for name, value in values.items()
+                       if _value_key(value) is not None}
+        self.timers = gui._timers.settings()
+        self.subscriptions = list(gui._observers.subscriptions)
+        self.weight = 0
+
+
+class GuiPool:
+    '''Pool of Gui instances for frequently reopened windows::
+
+        pool = GuiPool(make_dialog, maxsize=2)
+
+        gui = pool.acquire()
+        gui.show()
+
+    *factory* is called without arguments and must return a new Gui.
+    When the window of a Gui obtained from *acquire()* is closed, the Gui
+    is kept in the pool instead of being discarded, and is reset to the
+    state it had just after construction: property values are restored,
+    timers and observers added later are removed, and the timers started
+    by *factory* are restarted by the next *acquire()*, which returns it
+    again instead of building a new one. Guis that have been destroyed,
+    or whose window has been deleted, are dropped from the pool.
+
+    At most *maxsize* Guis are kept, and if *max_widgets* is given,
+    the total number of their widgets, including the inner widgets of
+    composite ones like labels, tables and widget banks, is kept below it.
+    Guis closed when the pool is full are discarded. *stats()* returns the
+    number of Guis created, reused and discarded, and the pool contents.
+    '''
+
+    def __init__(self, factory, maxsize=4, max_widgets=None):
+        self._factory = factory
+        self.maxsize = maxsize
+        self.max_widgets = max_widgets
+        self._free = []
+        self._entries = {}        # Gui -> _PoolEntry
+        self._created = 0
+        self._reused = 0
+        self._discarded = 0
+        self._pooled_widgets = 0
+
+    def acquire(self):
+        '''Returns a pooled Gui, or a new one if the pool is empty'''
+
+        while self._free:
+            gui = self._free.pop()
+            entry = self._entries[gui]
+            self._pooled_widgets -= entry.weight
+            if not self._usable(gui):
+                self._discard(gui)
+                continue
+
+            if gui._persistent:
+                _add_to_persistence_list(gui)
+            for name, args in entry.timers.items():
+                gui._timers.start(name, *args)
+            self._reused += 1
+            return gui
+
+        gui = self._factory()
+        if not isinstance(gui, Gui):
+            raise TypeError('GuiPool factory must return a Gui')
+
+        self._entries[gui] = _PoolEntry(gui)
+        gui._close_callbacks.append(self.release)
+        gui._destroy_callbacks.append(self._forget)
+        self._created += 1
+        return gui
+
+    def release(self, gui):
+        '''Put back *gui* into the pool. Called when its window closes.'''
+
+        if gui in self._free or gui not in self._entries:
+            return
+
+        weight = self._weight(gui)
+        if (
+            len(self._free) >= self.maxsize
+            or (self.max_widgets is not None and
+                self._pooled_widgets + weight > self.max_widgets)
+        ):
+            self._discard(gui)
+            return
+
+        _remove_from_persistence_list(gui)
+        self._reset(gui)
+        self._entries[gui].weight = weight
+        self._free.append(gui)
+        self._pooled_widgets += weight
+
+    @staticmethod
+    def _usable(gui):
+        '''False if *gui* was destroyed or its window deleted'''
+        if _registry.get(id(gui)) is not gui:
+            return False
+        return gui._window is None or not _is_deleted(gui._window)
+
+    @staticmethod
+    def _weight(gui):
+        '''Number of widgets of *gui*, including the inner ones'''
+        return len(gui.window().findChildren(QWidget))
+
+    def _reset(self, gui):
+        entry = self._entries[gui]
+        gui._timers.close()
+        gui._observers.subscriptions[:] = entry.subscriptions
+        with gui.batch():
+            for name, value in entry.values.items():
+                if name in gui._guietta_properties:
+                    gui.proxy(name).set(value)
+
+    def _forget(self, gui):
+        '''Drop *gui*, called when it is destroyed'''
+        if gui in self._free:
+            self._free.remove(gui)
+            self._pooled_widgets -= self._entries[gui].weight
+        if gui in self._entries:
+            self._discard(gui)
+
+    def _discard(self, gui):
+        if self.release in gui._close_callbacks:
+            gui._close_callbacks.remove(self.release)
+        if self._forget in gui._destroy_callbacks:
+            gui._destroy_callbacks.remove(self._forget)
+        del self._entries[gui]
+        self._discarded += 1
+
+    def clear(self):
+        '''Discard all pooled Guis'''
+
+        for gui in self._free:
+            self._discard(gui)
+        self._free.clear()
+        self._pooled_widgets = 0
+
+    def stats(self):
+        return PoolStats(self._created, self._reused, self._discarded,
+                         len(self._free), self._pooled_widgets)
+
+
+#######################
+# Async processing
 
-def _background_processing(gui, func, callback, *args):
+class Priority(Enum):
+    '''Enum type for the priority of calls executed in the main thread'''
 
-    result = func(*args)
-    if callback:
+    INTERACTIVE = 1         # Executed first (default)
+    BULK = 2                # Executed when no interactive calls are pending
+
+
+DispatcherStats = namedtuple('DispatcherStats',
+                             'queue_depth max_queue_depth dispatched '
+                             'wakeups mean_latency max_latency')
+
+
+class _Dispatcher(QObject):
+    '''Executes in the main thread the calls posted by other threads.
+
+    A single instance lives in the main thread for the whole application.
+    Calls are appended to one deque per priority lane, and a single
+    wakeup event is posted until the main thread gets around to process it.
+    Every wakeup drains up to *max_calls* calls or *max_time* seconds,
+    whichever comes first, interactive ones first. Any leftover calls are
+    processed by a new wakeup, in order to keep the event loop responsive.
+    '''
+
+    max_calls = 200
+    max_time = 0.02
+
+    def __init__(self):
+        super().__init__()
+        self._lanes = [deque(), deque()]    # In Priority order
+        self._lock = threading.Lock()
+        self._wakeup_pending = False
+        self._dispatched = 0
+        self._wakeups = 0
+        self._total_latency = 0.0
+        self._max_latency = 0.0
+        self._max_queue_depth = 0
+
+    def post(self, callback, args, priority=Priority.INTERACTIVE):
+        lane = self._lanes[priority.value - 1]
+        lane.append((time.perf_counter(), callback, args))
+        self._max_queue_depth = max(self._max_queue_depth, self.queue_depth())
+        self._wakeup()
+
+    def queue_depth(self):
+        return sum(len(lane) for lane in self._lanes)
+
+    def _wakeup(self):
+        with self._lock:
+            if self._wakeup_pending:
+                return
+            self._wakeup_pending = True
+        QApplication.postEvent(self, QEvent(QEvent.User))
+
+    def customEvent(self, ev):
+        # Clear the flag before draining: calls posted from now on
+        # will either be drained here or trigger a new wakeup.
+        with self._lock:
+            self._wakeup_pending = False
+        self._wakeups += 1
+        try:
+            self.drain(self.max_calls, self.max_time)
+        finally:
+            if self.queue_depth() > 0:
+                self._wakeup()
+
+    def drain(self, max_calls=None, max_time=None):
+        '''Execute pending calls. Must be called in the main thread'''
+
+        start = time.perf_counter()
+        ncalls = 0
+        while True:
+            if max_calls is not None and ncalls >= max_calls:
+                break
+            if max_time is not None and time.perf_counter() - start > max_time:
+                break
+            for lane in self._lanes:
+                if lane:
+                    t0, callback, args = lane.popleft()
+                    break
+            else:
+                break
+
+            latency = time.perf_counter() - t0
+            self._dispatched += 1
+            self._total_latency += latency
+            self._max_latency = max(self._max_latency, latency)
+            ncalls += 1
+            callback(*args)
+
+    def stats(self):
+        if self._dispatched > 0:
+            mean_latency = self._total_latency / self._dispatched
+        else:
+            mean_latency = 0.0
+        return DispatcherStats(self.queue_depth(), self._max_queue_depth,
+                               self._dispatched, self._wakeups,
+                               mean_latency, self._max_latency)
+
+
+_dispatcher_instance = None
+_dispatcher_lock = threading.Lock()
+
+
+def _dispatcher():
+    '''Returns the application dispatcher, creating it if needed'''
+
+    global _dispatcher_instance
+
+    with _dispatcher_lock:
+        if _dispatcher_instance is None:
+            dispatcher = _Dispatcher()
+            main_thread = QApplication.instance().thread()
+            if dispatcher.thread() != main_thread:
+                dispatcher.moveToThread(main_thread)
+            _dispatcher_instance = dispatcher
+    return _dispatcher_instance
+
+
+def _post_to_main_thread(callback, args, priority=Priority.INTERACTIVE):
+    '''Arrange for callback(*args) to be called in the main thread'''
+
+    _dispatcher().post(callback, args, priority)
+
+
+def dispatcher_stats():
+    '''Returns statistics about calls posted to the main thread.
+
+    The result is a *DispatcherStats* namedtuple with the current
+    and maximum number of pending calls, the number of calls dispatched
+    so far, the number of event loop wakeups used to dispatch them,
+    and the mean and maximum latency in seconds between posting a call
+    and its execution.
+    '''
+    return _dispatcher().stats()
+
+
+class Task:
+    '''Handle for a function running in a background thread.
+
+    Returned by Gui.execute_in_background(). Cancellation is cooperative:
+    cancel() just sets a flag, that the background function can check
+    using current_task()::
+
+        def long_job():
+            task = current_task()
+            for chunk in chunks:
+                if task.cancelled:
+                    return
+                ...
+
+    The callback of a cancelled task is never called.
+    '''
+
+    def __init__(self, gui):
+        self._gui = gui
+        self._cancel_event = threading.Event()
+        self._thread = None
+
+    @property
+    def cancelled(self):
+        '''True if cancel() has been called'''
+        return self._cancel_event.is_set()
+
+    def cancel(self):
+        '''Request the task to stop'''
+        self._cancel_event.set()
+
+    def sleep(self, seconds):
+        '''Sleep for *seconds*, waking up early if the task is cancelled.
+
+        Returns True if the task has been cancelled.
+        '''
+        return self._cancel_event.wait(seconds)
+
+    def is_alive(self):
+        '''True if the background thread is still running'''
+        return self._thread is not None and self._thread.is_alive()
+
+    def join(self, timeout=None):
+        '''Wait for the background thread to terminate'''
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+
+_task_local = threading.local()
+
+
+def current_task():
+    '''Returns the Task running in the current thread, or None'''
+    return getattr(_task_local, 'task', None)
+
+
+def _background_processing(gui, task, func, callback, *args):
+
+    _task_local.task = task
+    try:
+        result = func(*args)
+    except BaseException:
+        gui._forget_task(task)
+        raise
+
+    # The task stays tracked until its callback is delivered, so that
+    # closing the window in the meantime still cancels it.
+    if callback and not task.cancelled:
         if not _sequence(result):
             result = (result,)
-        app = QApplication.instance()
         args = (gui,) + result
-        app.postEvent(app, _result_event(QEvent.User, callback, args))
+        _post_to_main_thread(_deliver_callback, (gui, task, callback, args))
+    else:
+        gui._forget_task(task)
+
+
+class PollTask(Task):
+    '''Task returned by Gui.poll().
+
+    In addition to the Task interface, *ticks* counts the calls done so far
+    and *skipped_ticks* the ticks skipped because a call overran its interval.
+    '''
+
+    def __init__(self, gui):
+        super().__init__(gui)
+        self.ticks = 0
+        self.skipped_ticks = 0
+
 
+def _poll_processing(gui, task, func, interval, deliver):
+    '''Call *func* every *interval* seconds until *task* is cancelled'''
+
+    _task_local.task = task
+    try:
+        next_time = time.monotonic()
+        while not task.cancelled:
+            try:
+                result = func()
+            except Exception as e:
+                task.cancel()
+                _post_to_main_thread(_exception_handler, (e, gui))
+                break
+            task.ticks += 1
+            deliver(result)
+
+            # Deadlines are absolute to avoid drift. If the call
+            # overran, skip the ticks that are already in the past.
+            next_time += interval
+            now = time.monotonic()
+            if next_time < now:
+                missed = int((now - next_time) / interval) + 1
+                next_time += missed * interval
+                task.skipped_ticks += missed
+            if task.sleep(next_time - now):
+                break
+    finally:
+        gui._forget_task(task)
+
+
+class _Coalescer:
+    '''Delivers values to the main thread, dropping all but the newest.
+
+    Only one delivery is queued at any time. Values arriving while
+    it is pending replace the previous one.
+    '''
+
+    def __init__(self, task, func):
+        self._task = task
+        self._func = func
+        self._lock = threading.Lock()
+        self._value = None
+        self._scheduled = False
+
+    def __call__(self, value):
+        with self._lock:
+            self._value = value
+            if self._scheduled:
+                return
+            self._scheduled = True
+        _post_to_main_thread(self._flush, (), Priority.BULK)
+
+    def _flush(self):
+        with self._lock:
+            value = self._value
+            self._value = None
+            self._scheduled = False
+        if not self._task.cancelled:
+            self._func(value)
+
+
+def _deliver_callback(gui, task, callback, args):
+    '''Call a background callback, unless its task has been cancelled'''
+
+    gui._forget_task(task)
+    if not task.cancelled:
+        callback(*args)
+
+
+class _MainThreadFuture(Future):
+    '''Future for a call executed in the main thread.
+
+    Waiting for the result in the main thread itself would block forever,
+    and raises a RuntimeError instead. A wait that times out cancels
+    the call if it has not been started yet.
+    '''
+
+    def __init__(self, main_thread):
+        super().__init__()
+        self._main_thread = main_thread
+
+    def _check_deadlock(self):
+        if not self.done() and threading.get_ident() == self._main_thread:
+            raise RuntimeError('Waiting in the main thread for a main thread '
+                               'call would deadlock')
+
+    def result(self, timeout=None):
+        self._check_deadlock()
+        try:
+            return super().result(timeout)
+        except _FutureTimeoutError:
+            self.cancel()
+            raise
+
+    def exception(self, timeout=None):
+        self._check_deadlock()
+        return super().exception(timeout)
+
+
+def _run_into_future(future, f, args):
+    '''Call f(*args) and store the outcome into *future*'''
+
+    if not future.set_running_or_notify_cancel():
+        return
+    try:
+        result = f(*args)
+    except Exception as e:
+        future.set_exception(e)
+    else:
+        future.set_result(result)
 
-def _customEvent(ev):
-    '''Replacement of QApplication.customEvent()'''
 
-    callback = ev.callback
-    args = ev.args
-    callback(*args)
+#######################
+# Timers
+# All named timers of a Gui share a single QTimer, that is re-armed
+# for the nearest deadline every time it fires.
+
+class TimerPolicy(Enum):
+    '''Enum type for timers whose callback overruns the interval'''
+
+    SKIP = 1                # Skip the missed ticks (default)
+    CATCH_UP = 2            # Fire the missed ticks as soon as possible
+
+
+TimerStats = namedtuple('TimerStats',
+                        'count overruns skipped mean_jitter max_jitter')
+
+
+class _NamedTimer:
+    '''Settings and statistics of a single timer'''
+
+    max_catch_up = 10       # Max backlog of ticks for TimerPolicy.CATCH_UP
+
+    def __init__(self):
+        self.count = 0
+        self.overruns = 0
+        self.skipped = 0
+        self.total_jitter = 0.0
+        self.max_jitter = 0.0
+        self.active = False
+
+    def start(self, callback, interval, precise, policy):
+        self.callback = callback
+        self.interval = interval
+        self.precise = precise
+        self.policy = policy
+        self.deadline = time.perf_counter() + interval
+        self.active = True
+
+    def fire(self, now):
+        jitter = now - self.deadline
+        self.count += 1
+        self.total_jitter += jitter
+        self.max_jitter = max(self.max_jitter, jitter)
+
+        # The deadline advances even if the callback raises,
+        # otherwise the timer would fire again immediately.
+        try:
+            self.callback()
+        finally:
+            self._advance()
+
+    def _advance(self):
+        self.deadline += self.interval
+        end = time.perf_counter()
+        if self.deadline < end:
+            self.overruns += 1
+            missed = int((end - self.deadline) / self.interval) + 1
+            if (self.policy == TimerPolicy.SKIP) or \
+               (missed > self.max_catch_up):
+                self.deadline += missed * self.interval
+                self.skipped += missed
+
+    def stats(self):
+        if self.count > 0:
+            mean_jitter = self.total_jitter / self.count
+        else:
+            mean_jitter = 0.0
+        return TimerStats(self.count, self.overruns, self.skipped,
+                          mean_jitter, self.max_jitter)
+
+
+class _TimerScheduler:
+    '''Drives any number of named timers with a single QTimer'''
+
+    def __init__(self):
+        self._timers = {}
+        self._qtimer = QTimer()
+        self._qtimer.setSingleShot(True)
+        self._qtimer.timeout.connect(self._on_timeout)
+
+    def start(self, name, callback, interval, precise, policy):
+        if interval <= 0:
+            raise ValueError('Timer interval must be positive')
+        timer = self._timers.setdefault(name, _NamedTimer())
+        timer.start(callback, interval, precise, policy)
+        self._arm()
+
+    def stop(self, name=None):
+        if name is None:
+            timers = self._timers.values()
+        elif name in self._timers:
+            timers = [self._timers[name]]
+        else:
+            timers = []
+        for timer in timers:
+            timer.active = False
+        self._arm()
+
+    def close(self):
+        '''Stop and forget all timers'''
+        self._qtimer.stop()
+        self._timers.clear()
+
+    def settings(self):
+        '''Arguments of start() for each active timer, by name'''
+        return {name: (t.callback, t.interval, t.precise, t.policy)
+                for name, t in self._timers.items() if t.active}
+
+    def stats(self, name):
+        try:
+            return self._timers[name].stats()
+        except KeyError:
+            raise KeyError('No timer named %s' % name) from None
+
+    def _active(self):
+        return [t for t in self._timers.values() if t.active]
+
+    def _arm(self):
+        active = self._active()
+        if not active:
+            self._qtimer.stop()
+            return
+
+        if any(t.precise for t in active):
+            self._qtimer.setTimerType(Qt.PreciseTimer)
+        else:
+            self._qtimer.setTimerType(Qt.CoarseTimer)
+
+        deadline = min(t.deadline for t in active)
+        delay = deadline - time.perf_counter()
+        self._qtimer.start(max(0, int(delay * 1000)))
+
+    def _on_timeout(self):
+        try:
+            for timer in sorted(self._active(), key=lambda t: t.deadline):
+                now = time.perf_counter()
+                # Fire timers due within half a millisecond, since
+                # QTimer has a millisecond resolution.
+                if timer.active and timer.deadline <= now + 0.0005:
+                    timer.fire(now)
+        finally:
+            self._arm()
 
 
 def splash(text,
@@ -1864,6 +4190,7 @@ class Gui:
     DYNAMIC = 2
 
     def __init__(self, *lists, images_dir='.',
+                               watch_images=False,
                                create_properties=True,
                                exceptions=Exceptions.POPUP,
                                persistence=PERSISTENT,
@@ -1871,7 +4198,9 @@ class Gui:
                                font=None,
                                manage_threads=True,
                                setup=None,
-                               use_formats=True):
+                               use_formats=True,
+                               progressive=False,
+                               splash_text=None):
 
         # This line must be the first one in this method otherwise
         # __setattr__ does not work.
@@ -1879,11 +4208,21 @@ class Gui:
 
         self.userdata = SimpleNamespace()
 
-        if persistence == self.PERSISTENT:
+        self._persistent = persistence == self.PERSISTENT
+        if self._persistent:
             _add_to_persistence_list(self)
+        _registry[id(self)] = self
+        self._close_callbacks = []        # Called after the window closes
+        self._destroy_callbacks = []      # Called by destroy()
+        self._watchdog = None
 
         self._layout = QGridLayout()
         self._widgets = {}                # widgets by name
+        # Cells of the widgets placed by this Gui. The layout itself is
+        # the reference for everything else, including widgets added
+        # directly to gui.layout()
+        self._positions = {}              # widget -> (row, col, rowspan,
+                                          #            colspan)
         self._counter = defaultdict(int)  # widgets counter
         self._original_names = {}         # Reverse widget name lookup
         self._window = None
@@ -1893,9 +4232,11 @@ class Gui:
         self._manage_threads = manage_threads
         self._main_thread = threading.get_ident()
 
-        self._timer = None
-        self._timer_count = 0
-        self._user_timer_callback = None
+        self._timers = _TimerScheduler()
+
+        self._tasks = set()               # Running background tasks
+        self._tasks_lock = threading.Lock()
+        self.shutdown_timeout = 1.0       # Max wait for tasks on close
 
         self._get_handler = False   # These three for the get() method
         self._event_queue = queue.Queue()
@@ -1904,7 +4245,16 @@ class Gui:
         self._exception_mode = exceptions
         self._create_properties = create_properties
 
+        self._batch = None                # Pending batch() assignments
+        self._mirror = _ValueMirror()
+        self._mirror_names = {}           # widget -> property name
+        self._mirror_connected = set()    # widgets with a change signal
+        self._auto_graph = _AutoGraph(self)
+        self._observers = _Observers(self)
+
         self.images_dir = images_dir
+        if watch_images:
+            _image_index(images_dir).watch()
         self.is_running = False
         self.use_formats = use_formats
 
@@ -1921,27 +4271,133 @@ class Gui:
 
         # Input argument checks
         lists, row_stretches, col_stretches = detect_and_remove_stretches(lists)
-        self._rows = Rows(lists)
+        self._pending_rows = deque()
+        self._splash = None
+
+        if progressive:
+            if progressive is True:
+                progressive = self.build_budget
+            Rows.check(lists)
+            chunks = deque(_row_chunks(lists))
+            self._rows = self._build(chunks.popleft())[0]
+            self._pending_rows = chunks
+            self._total_rows = len(lists)
+        else:
+            self._rows = self._build(lists)[0]
+
+        for k,v in col_stretches.items():
+            self._layout.setColumnStretch(k, v)
+
+        for k,v in row_stretches.items():
+            self._layout.setRowStretch(k, v)
+
+        self._align_guietta_properties()
+        self.title(title)
+
+        if self._pending_rows:
+            if splash_text is not None:
+                self._splash_text = splash_text
+                self._splash = splash(splash_text)
+            self._build_pending(progressive)
+
+    # Default time budget in seconds for each step of a progressive build
+    build_budget = 0.05
+
+    @property
+    def building(self):
+        '''True while a progressive build still has rows to create.
+
+        Accessing a widget by name or coordinates only builds the rows up
+        to the one that defines it. Reading *widgets*, *add_row()*,
+        *insert()* and unknown names build all the remaining rows.
+        '''
+        return len(self._pending_rows) > 0
+
+    def _build_pending(self, budget=None):
+        '''Build pending rows for up to *budget* seconds (all of them if
+        None), and schedule the rest for the next event loop iteration.'''
+
+        deadline = None if budget is None else time.perf_counter() + budget
+        while self._pending_rows:
+            self._build_chunk()
+            if deadline is not None and time.perf_counter() > deadline:
+                break
+
+        self._show_build_progress()
+        if self._pending_rows and budget is not None:
+            QTimer.singleShot(0, functools.partial(self._build_pending,
+                                                   budget))
 
-        self._rows.map_in_place(_convert_compacts)
-        self._rows.map_in_place(_create_default_widgets)
-        self._rows.map_in_place(functools.partial(_create_deferred, self))
-        self._rows.map_in_place(_collapse_names)
-        self._rows.map_in_place(_check_widget)
+    def _build_chunk(self):
+        '''Build the next chunk of pending rows'''
 
+        chunk = self._pending_rows.popleft()
+        rows, names = self._build(chunk, row_offset=len(self._rows))
+        self._rows.rows.extend(rows.rows)
+        for name in names:
+            self._add_property(name, self._widgets[name])
+
+    def _show_build_progress(self):
+        '''Update the splash screen, closing it at the end of the build'''
+
+        if self._splash is None:
+            return
+        if self._pending_rows:
+            percent = 100 * len(self._rows) // self._total_rows
+            self._splash.showMessage('%s %d%%' % (self._splash_text, percent),
+                                     alignment=Qt.AlignHCenter | Qt.AlignVCenter)
+        else:
+            self._splash.close()
+            self._splash = None
+
+    def _build_until(self, done):
+        '''Build pending rows, one chunk at a time, until *done()*
+        returns True or there is nothing left to build'''
+
+        if not self.__dict__.get('_pending_rows'):
+            return
+        while self._pending_rows and not done():
+            self._build_chunk()
+        self._show_build_progress()
+
+    def _build_rows(self, n):
+        '''Make sure that the first *n* rows have been built'''
+        self._build_until(lambda: len(self._rows) >= n)
+
+    def _build_name(self, name):
+        '''Build pending rows until widget *name* exists'''
+        self._build_until(lambda: name in self._widgets)
+
+    def _finish_building(self):
+        '''Build all remaining rows of a progressive build now'''
+        if self.__dict__.get('_pending_rows'):
+            self._build_pending(None)
+
+    def _build(self, lists, row_offset=0):
+        '''Create and place the widgets of *lists* starting at
+        layout row *row_offset*. Returns the processed rows and
+        the names of the new widgets.'''
+
+        rows = Rows(lists)
+
+        rows.map_in_place(_convert_compacts)
+        rows.map_in_place(_create_default_widgets)
+        rows.map_in_place(functools.partial(_create_deferred, self))
+        rows.map_in_place(_collapse_names)
+        rows.map_in_place(_check_widget)
 
         # Intermediate step that will be filled by replicating
         # widgets when ___ and III are encountered.
-        step1 = self._rows.copy(init=None)
+        step1 = rows.copy(init=None)
 
         # Expand the combined widgets
-        for i, j, element in self._rows.enumerate(skip_specials=False):
+        for i, j, element in rows.enumerate(skip_specials=False):
             if isinstance(element, _CombinedWidget):
-                element.place(self._rows, i, j)  # This modifies rows
+                element.place(rows, i, j)  # This modifies rows
 
         # Expand remaining ___ and 'III' replicating
         # the widgets from the previous column and row.
-        for i, j, element in self._rows.enumerate(skip_specials=False):
+        for i, j, element in rows.enumerate(skip_specials=False):
             if element == _:
                 element = None
             else:
@@ -1964,34 +4420,44 @@ class Gui:
         # and in columns. Look for repetitions to calculate spans.
 
         done = set([None])  # Skip empty elements
+        names = []
         for i, j, element in step1.enumerate():
             if element not in done:
                 rowspan = 0
                 colspan = 0
-                for ii in range(i, len(lists)):
+                for ii in range(i, len(rows)):
                     if step1[ii, j] == element:
                         rowspan += 1
-                for jj in range(j, len(lists[0])):
+                for jj in range(j, len(rows[0])):
                     if step1[i, jj] == element:
                         colspan += 1
 
                 widget, name = self._get_widget_and_name(element)
-                if hasattr(widget, '_gui'):
-                    raise Exception("Widget %s already has a '_gui' attribute" % name)
-                widget._gui = self
-                ContextMixIn.convert_object(widget)
-                self._layout.addWidget(widget, i, j, rowspan, colspan)
-                self._widgets[name] = widget
+                self._add_widget(widget, name, i + row_offset, j,
+                                 rowspan, colspan)
+                names.append(name)
                 done.add(element)
 
-        for k,v in col_stretches.items():
-            self._layout.setColumnStretch(k, v)
+        return rows, names
 
-        for k,v in row_stretches.items():
-            self._layout.setRowStretch(k, v)
+    def _add_widget(self, widget, name, row, col, rowspan=1, colspan=1):
+        '''Place a single widget in the layout and register it'''
 
-        self._align_guietta_properties()
-        self.title(title)
+        if hasattr(widget, '_gui'):
+            raise Exception("Widget %s already has a '_gui' attribute" % name)
+        widget._gui = self
+        ContextMixIn.convert_object(widget)
+        self._layout.addWidget(widget, row, col, rowspan, colspan)
+        self._widgets[name] = widget
+        self._positions[widget] = (row, col, rowspan, colspan)
+
+    def _replace_widget(self, widget, new):
+        '''Put *new* in the layout cells of *widget*'''
+
+        self._layout.replaceWidget(widget, new)
+        position = self._positions.pop(widget, None)
+        if position is not None:
+            self._positions[new] = position
 
     def _setup(self):
         '''
@@ -2012,32 +4478,147 @@ class Gui:
         '''Make sure that any and all widgets have a property'''
 
         self._guietta_properties.clear()
+        self._mirror.clear()
+        self._mirror_names.clear()
         if not self._create_properties:
             return
 
         for name, widget in self._widgets.items():
-            if hasattr(widget, '__guietta_property__'):
-                prop = widget.__guietta_property__()
-                if isinstance(prop, GuiettaProperty):
-                    pass
-                else:
-                    try:
-                        get, set = widget.__guietta_property__()
-                        assert callable(get)
-                        assert callable(set)
-                    except (TypeError, AssertionError) as e:
-                        errmsg = ('__guietta_property__() must return '
-                                  'a tuple with two callables')
-                        raise TypeError(errmsg) from e
-
-                    prop = GuiettaProperty(get, set, widget)
+            self._add_property(name, widget)
+
+    def _add_property(self, name, widget):
+        '''Create the magic property for a single widget'''
+
+        if not self._create_properties:
+            return
+
+        if hasattr(widget, '__guietta_property__'):
+            prop = widget.__guietta_property__()
+            if isinstance(prop, GuiettaProperty):
+                pass
             else:
-                prop = _guietta_property(widget)
-            self._guietta_properties[name] = prop
+                try:
+                    get, set = widget.__guietta_property__()
+                    assert callable(get)
+                    assert callable(set)
+                except (TypeError, AssertionError) as e:
+                    errmsg = ('__guietta_property__() must return '
+                              'a tuple with two callables')
+                    raise TypeError(errmsg) from e
+
+                prop = GuiettaProperty(get, set, widget)
+        else:
+            prop = _guietta_property(widget)
+        self._guietta_properties[name] = prop
+        self._mirror_track(name, widget, prop)
+
+    def _remove_property(self, name, widget):
+        '''Remove the magic property of a single widget'''
+
+        self._guietta_properties.pop(name, None)
+        self._mirror.remove(name)
+        if self._mirror_names.get(widget) == name:
+            del self._mirror_names[widget]
+
+    def _mirror_track(self, name, widget, prop):
+        '''Keep the value mirror updated for property *name*'''
+
+        prop.on_change = functools.partial(self._property_assigned, name)
+        self._mirror_names[widget] = name
+        self._mirror.update(name, prop.get())
+
+        if widget not in self._mirror_connected:
+            signal_name = _change_signal_lookup(widget)
+            if signal_name is not None:
+                handler = functools.partial(self._mirror_widget_changed,
+                                            widget)
+                getattr(widget, signal_name).connect(handler)
+                self._mirror_connected.add(widget)
+
+    def _property_assigned(self, name):
+        '''Called after each assignment to property *name*'''
+
+        self._mirror_refresh(name)
+        self._auto_graph.invalidate(name)
+
+    def _mirror_refresh(self, name):
+        '''Copy the current value of property *name* into the mirror'''
+
+        prop = self._guietta_properties.get(name)
+        if prop is not None:
+            value = prop.get()
+            try:
+                old = self._mirror.get(name)
+            except AttributeError:
+                old = None
+            self._mirror.update(name, value)
+            self._observers.changed(name, old, value)
+
+    def _mirror_widget_changed(self, widget, *args):
+        name = self._mirror_names.get(widget)
+        if name is not None:
+            self._guietta_properties[name].invalidate()
+            self._mirror_refresh(name)
+
+    @contextlib.contextmanager
+    def batch(self):
+        '''Context manager to update many properties with a single repaint::
+
+            with gui.batch():
+                gui.label1 = 'foo'
+                gui.label2 = 'bar'
+                ...
+
+        Window updates are suspended, and property assignments are
+        collected and applied all together when the block exits, including
+        those posted by other threads in the meantime, as long as they fit
+        in one dispatcher wakeup (see *_Dispatcher.max_calls* and
+        *max_time*). Any other posted call is left to the event loop
+        as usual. If a property
+        is assigned more than once, only the last value is applied.
+        Reading a property inside the block returns the value
+        before the block. Must be used in the main thread.
+        '''
+        if threading.get_ident() != self._main_thread:
+            raise RuntimeError('batch() must be used in the main thread')
+
+        if self._batch is not None:   # Nested block
+            yield
+            return
+
+        window = self.window()
+        updates_enabled = window.updatesEnabled()
+        window.setUpdatesEnabled(False)
+        self._batch = {}
+        try:
+            yield
+        finally:
+            try:
+                dispatcher = _dispatcher()
+                dispatcher.drain(dispatcher.max_calls, dispatcher.max_time)
+            finally:
+                pending, self._batch = self._batch, None
+                try:
+                    for f, value in pending.values():
+                        f(value)
+                finally:
+                    self._layout.activate()
+                    window.setUpdatesEnabled(updates_enabled)
+
+    def snapshot(self):
+        '''Returns a consistent copy of all property values.
+
+        This method can be called from any thread. The result is a
+        *Snapshot* namedtuple with two members: *version*, a counter that
+        is incremented at every value change, and *values*, a dictionary
+        of property values by name.
+        '''
+        return self._mirror.snapshot()
 
     @property
     def widgets(self):
         '''Read-only property with the widgets dictionary'''
+        self._finish_building()
         return self._widgets
 
     @property
@@ -2049,17 +4630,28 @@ class Gui:
         '''Returns the *guietta property* for a (normalized) widget name.
 
         A guietta property is an instance of the *GuiettaProperty* class,
-        with two attributes: get() and set()
+        with two attributes: get() and set(). Its *skipped* attribute
+        counts the assignments skipped because the value did not change.
         '''
         name = normalized(name)
+        self._build_name(name)
         return self.__dict__['_guietta_properties'][name]
 
     def __getattr__(self, name):
         '''Use guietta_properties to emulate properties on this instance'''
 
         if name in self.__dict__['_guietta_properties']:
+            # Other threads read the mirrored value instead of the widget
+            if (self._manage_threads and
+                    threading.get_ident() != self._main_thread):
+                return self._mirror.get(name)
             return self.__dict__['_guietta_properties'][name].get()
 
+        # The widget might not have been built yet
+        if self.__dict__.get('_pending_rows') and not name.startswith('_'):
+            self._build_name(name)
+            return getattr(self, name)
+
         # Default behaviour
         raise AttributeError(name)
 
@@ -2070,6 +4662,13 @@ class Gui:
             self.__dict__['_guietta_properties'][name].set(value)
             return
 
+        # The widget might not have been built yet
+        if self.__dict__.get('_pending_rows') and not name.startswith('_'):
+            self._build_name(name)
+            if name in self.__dict__['_guietta_properties']:
+                self.__dict__['_guietta_properties'][name].set(value)
+                return
+
         # Default behaviour
         super().__setattr__(name, value)
 
@@ -2119,6 +4718,7 @@ class Gui:
         setRowStretch() QT function, or _ if no particular stretch is desired.
         '''
         rows = Rows(lists)
+        self._build_rows(len(rows))
         rows.check_same(self._rows, allow_less_rows=True)
 
         for i, _, stretch in rows.enumerate():
@@ -2136,6 +4736,7 @@ class Gui:
         is desired.
         '''
         rows = Rows(lists)
+        self._build_rows(len(rows))
         rows.check_same(self._rows, allow_less_rows=True)
 
         for _, j, stretch in rows.enumerate():
@@ -2164,6 +4765,7 @@ class Gui:
         to this Gui instance.
         '''
         rows = Rows(lists)
+        self._build_rows(len(rows))
         rows.check_same(self._rows, allow_less_rows=True)
 
         rows.map_in_place(_process_slots)
@@ -2195,6 +4797,7 @@ class Gui:
         Use _ for widgets that do not need their fonts to be changed.
         '''
         rows = Rows(lists)
+        self._build_rows(len(rows))
         rows.check_same(self._rows, allow_less_rows=True)
 
         rows.map_in_place(_process_font)
@@ -2214,11 +4817,13 @@ class Gui:
         need to be renamed.
         '''
         rows = Rows(lists)
+        self._build_rows(len(rows))
         rows.check_same(self._rows, allow_less_rows=True)
 
         rows.map_in_place(_check_string)
 
         names_by_widget = {v: k for k, v in self._widgets.items()}
+        renamed = []
 
         for i, j, new_name in rows.enumerate():
             widget = self[i, j]
@@ -2226,42 +4831,193 @@ class Gui:
 
             self._widgets[new_name] = self._widgets[old_name]
             del self._widgets[old_name]
+            renamed.append((old_name, new_name, widget))
+
+        for old_name, new_name, widget in renamed:
+            self._remove_property(old_name, widget)
+        for old_name, new_name, widget in renamed:
+            self._add_property(new_name, widget)
+
+    def add_row(self, row, index=None):
+        '''Add a row of widgets to an existing Gui.
+
+        *row* is a list with the same format used in the initializer,
+        and must have the same number of columns as the other rows,
+        unless it has a single element. The row is appended at the end,
+        or inserted before row *index* moving the following rows down,
+        including any widget added directly to the layout.
+        Returns the names of the new widgets.
+        '''
+        self._finish_building()
+        ncols = len(self._rows[0])
+        row = list(row)
+        if len(row) == 1:
+            row += [___] * (ncols - 1)
+        if len(row) != ncols:
+            raise ValueError('Row lengths differ:'
+                             ' row has %d elements instead of %d' %
+                             (len(row), ncols))
+
+        nrows = len(self._rows)
+        if index is None or index >= nrows:
+            index = nrows
+        else:
+            self._shift_rows(index, 1)
 
-        self._align_guietta_properties()
+        rows, names = self._build([row], row_offset=index)
+        self._rows.rows.insert(index, rows[0])
+
+        for name in names:
+            self._add_property(name, self._widgets[name])
+        return names
+
+    def _shift_rows(self, index, n):
+        '''Move all layout items at or below row *index* down by *n* rows.
+
+        The layout is the reference for item positions, so that items
+        added directly to gui.layout() move as well. Items are taken in
+        a single backward pass, which keeps the indices still to be
+        visited valid, instead of looking up every moved widget.
+        '''
+        layout = self._layout
+        moved = []
+        for k in range(layout.count() - 1, -1, -1):
+            r, c, rs, cs = layout.getItemPosition(k)
+            if r >= index:
+                moved.append((layout.takeAt(k), r, c, rs, cs))
+        for item, r, c, rs, cs in reversed(moved):
+            layout.addItem(item, r + n, c, rs, cs)
+            widget = item.widget()
+            if widget in self._positions:
+                self._positions[widget] = (r + n, c, rs, cs)
+
+        for r in range(len(self._rows) - 1, index - 1, -1):
+            layout.setRowStretch(r + n, layout.rowStretch(r))
+        for r in range(index, index + n):
+            layout.setRowStretch(r, 0)
+
+    def insert(self, row, col, element):
+        '''Place a single widget in an empty cell.
+
+        *element* can be anything accepted in the initializer rows.
+        If *row* is beyond the last row, empty rows are added.
+        Returns the name of the new widget.
+        '''
+        self._finish_building()
+        ncols = len(self._rows[0])
+        if not 0 <= col < ncols:
+            raise IndexError('Column %d out of range' % col)
+        while row >= len(self._rows):
+            self._rows.rows.append([_] * ncols)
+
+        if self._layout.itemAtPosition(row, col) is not None:
+            raise ValueError('Cell (%d, %d) is not empty' % (row, col))
+
+        cells = [_] * ncols
+        cells[col] = element
+        rows, names = self._build([cells], row_offset=row)
+        self._rows[row, col] = rows[0][col]
+
+        for name in names:
+            self._add_property(name, self._widgets[name])
+        return names[0] if len(names) == 1 else names
+
+    def remove(self, name):
+        '''Remove the widget *name* from the Gui.
+
+        The widget is hidden and detached from the Gui window, and its
+        grid cells become empty. The other widgets are not moved.
+        Only widgets placed by the Gui can be removed, widgets added
+        directly to the layout must be removed from it the same way.
+        Returns the removed widget, which no longer refers to this Gui.
+        '''
+        name = normalized(name)
+        self._build_name(name)
+        widget = self._widgets.pop(name)
+        self._original_names.pop(name, None)
+        self._remove_property(name, widget)
+        self._mirror_connected.discard(widget)
+
+        position = self._positions.pop(widget, None)
+        if position is not None:
+            r, c, rs, cs = position
+            for i in range(r, r + rs):
+                for j in range(c, c + cs):
+                    if i < len(self._rows):
+                        self._rows[i, j] = _
+        k = self._layout.indexOf(widget)
+        if k >= 0:
+            self._layout.takeAt(k)
+
+        widget.hide()
+        widget.setParent(None)
+        del widget._gui
+        return widget
 
-    def timer_start(self, callback, interval=1.0):
+    def timer_start(self, callback, interval=1.0, name='default',
+                    precise=False, policy=TimerPolicy.SKIP):
         '''Set up a timer to call *callback* every *interval* seconds.
 
         The callback will receive the Gui instance as its only argument.
+
+        Any number of timers can be active at the same time, as long as
+        they have a different *name*. Starting a timer with the name of an
+        existing one replaces its callback and interval. Set *precise*
+        to True to ask for millisecond accuracy instead of the default
+        coarse one. *policy* decides what happens to the ticks missed
+        when the callback takes longer than the interval: with
+        TimerPolicy.SKIP they are dropped, with TimerPolicy.CATCH_UP they
+        are fired as soon as possible.
         '''
-        self._timer = QTimer()
-        self._user_timer_callback = _exception_wrapper(callback, self)
-        self._timer.timeout.connect(self._timer_callback)
-        self._timer.start(int(interval*1000))
+        wrapped = _exception_wrapper(callback, self)
+        self._timers.start(name, functools.partial(wrapped, self),
+                           interval, precise, policy)
 
-    def timer_stop(self):
-        '''Stops the timer'''
-        if self._timer is not None:
-            self._timer.stop()
+    def timer_stop(self, name=None):
+        '''Stops the timer called *name*, or all timers if None'''
+        self._timers.stop(name)
 
-    def timer_count(self):
+    def timer_count(self, name='default'):
         '''Returns the number of times the timer has been fired'''
-        return self._timer_count
+        try:
+            return self._timers.stats(name).count
+        except KeyError:
+            return 0
+
+    def timer_stats(self, name='default'):
+        '''Returns the statistics of the timer called *name*.
+
+        The result is a *TimerStats* namedtuple with the number of times
+        the timer has been fired, the number of overruns and skipped ticks,
+        and the mean and maximum delay in seconds between the scheduled
+        and the actual firing time.
+        '''
+        return self._timers.stats(name)
+
+    def timer(self, name_or_interval, interval=None, precise=False,
+              policy=TimerPolicy.SKIP):
+        '''Decorator that starts a function using a GUI timer.
 
-    def _timer_callback(self):
-        self._timer_count += 1
-        if self._user_timer_callback is not None:
-            self._user_timer_callback(self)
+        Use either *@gui.timer(interval)* for the default timer,
+        or *@gui.timer('name', interval)* for a named one.
+        With *@gui.timer('name')*, the interval defaults to one second.
+        See timer_start() for the other arguments.
+        '''
+        if isinstance(name_or_interval, str):
+            name = name_or_interval
+            if interval is None:
+                interval = 1.0
+        else:
+            name, interval = 'default', name_or_interval
 
-    def timer(self, interval):
-        '''Decorator that starts a function using the GUI timer'''
         def decorator(func):
-            self.timer_start(func, interval)
+            self.timer_start(func, interval, name, precise, policy)
             return func
         return decorator
 
     def __getitem__(self, name):
         '''Widget by coordinates [row,col]'''
+        self._build_rows(name[0] + 1)
         return self._layout.itemAtPosition(name[0], name[1]).widget()
 
     def layout(self):
@@ -2287,6 +5043,57 @@ class Gui:
     def _close_handler(self, event):
         _remove_from_persistence_list(self)
         self.timer_stop()
+        self.stop_watchdog()
+        self.cancel_tasks(timeout=self.shutdown_timeout)
+        for callback in list(self._close_callbacks):
+            callback(self)
+
+    def destroy(self):
+        '''Release everything owned by this Gui.
+
+        The window is closed, timers are stopped, background tasks
+        are cancelled (waiting up to *shutdown_timeout* seconds),
+        and all widgets are scheduled for deletion, disconnecting their
+        signals. The Gui is removed from the persistence list and must
+        not be used afterwards.
+        '''
+        self._pending_rows.clear()
+        self._close_callbacks.clear()
+        for callback in list(self._destroy_callbacks):
+            callback(self)
+        self._destroy_callbacks.clear()
+        if self._window is not None:
+            self._window.close()
+
+        self._timers.close()
+        self.stop_watchdog()
+        self.cancel_tasks(timeout=self.shutdown_timeout)
+        _remove_from_persistence_list(self)
+        _registry.pop(id(self), None)
+
+        for widget in self._widgets.values():
+            if isinstance(widget, QObject):
+                widget.deleteLater()
+            widget.__dict__.pop('_gui', None)
+        for group in self._groups:
+            group.deleteLater()
+        if self._window is not None:
+            self._window.deleteLater()
+        else:
+            self._layout.deleteLater()
+
+        self._guietta_properties.clear()
+        self._widgets.clear()
+        self._original_names.clear()
+        self._positions.clear()
+        self._mirror.clear()
+        self._mirror_names.clear()
+        self._mirror_connected.clear()
+        self._auto_graph.clear()
+        self._observers.subscriptions.clear()
+        self._subguis_to_setup.clear()
+        self._groups = []
+        self._window = None
 
     def import_into(self, obj):
         '''
@@ -2407,6 +5214,7 @@ class Gui:
         self._event_queue.put((None, None, None))
         self._app.exit()  # Stop event loop
         _remove_from_persistence_list(self)
+        self.cancel_tasks(timeout=self.shutdown_timeout)
 
     def _timeout_handler(self):
         self._event_queue.put(('timeout', None, None))
@@ -2416,12 +5224,13 @@ class Gui:
         '''Sets the window title'''
         self.window().setWindowTitle(title)
 
-    def execute_in_main_thread(self, f, *args):
+    def execute_in_main_thread(self, f, *args, priority=Priority.INTERACTIVE):
         '''Make sure that f(args) is executed in the main GUI thread.
 
         If the caller is running a different thread, the call details
-        are packaged into a QT event that is emitted. It will be eventually
-        received by the main thread, which will execute the call.
+        are queued for the main thread dispatcher, that will eventually
+        execute the call. Calls with *priority* set to Priority.BULK
+        are only executed when no Priority.INTERACTIVE calls are pending.
         '''
         curr_thread = threading.get_ident()
         main_thread = self._main_thread
@@ -2429,9 +5238,34 @@ class Gui:
         if (curr_thread == main_thread) or (self._manage_threads is False):
             f(*args)
         else:
-            app = QApplication.instance()
-            app.customEvent = _customEvent
-            app.postEvent(app, _result_event(QEvent.User, f, args))
+            _post_to_main_thread(f, args, priority)
+
+    def call_in_main_thread(self, f, *args, priority=Priority.INTERACTIVE):
+        '''Executes f(args) in the main GUI thread and returns a Future.
+
+        Unlike execute_in_main_thread(), the return value of *f* (or the
+        exception it raised) is available from the returned
+        *concurrent.futures.Future*, so that a worker thread can wait
+        for it::
+
+            value = gui.call_in_main_thread(compute, x).result(timeout=1)
+
+        If the wait times out, the call is cancelled unless it has
+        already started. When called from the main thread, *f* is executed
+        immediately and the Future is already done. Waiting in the main
+        thread for an unfinished Future raises RuntimeError, since it
+        would deadlock. *priority* has the same meaning as in
+        execute_in_main_thread().
+        '''
+        future = _MainThreadFuture(self._main_thread)
+
+        curr_thread = threading.get_ident()
+        if (curr_thread == self._main_thread) or (self._manage_threads is False):
+            _run_into_future(future, f, args)
+        else:
+            _post_to_main_thread(_run_into_future, (future, f, args),
+                                 priority)
+        return future
 
     def execute_in_background(self, func, args=(), callback=None):
         '''
@@ -2441,6 +5275,9 @@ class Gui:
         The callback receives a reference to this Gui instance as the first
         argument, plus whatever was returned by `func` as additional
         arguments.
+
+        Returns a Task instance that can be used to cancel the execution.
+        All tasks are cancelled when the window is closed.
         '''
         if not callable(func):
             raise TypeError('func must be a callable')
@@ -2448,12 +5285,122 @@ class Gui:
             if not callable(callback):
                 raise TypeError('callback must be a callable')
 
-        app = QApplication.instance()
-        app.customEvent = _customEvent
+        task = Task(self)
+        self._start_task(task, _background_processing,
+                         (self, task, func, callback, *args))
+        return task
+
+    def poll(self, func, interval, target=None, callback=None):
+        '''Call *func* periodically in a dedicated background thread.
+
+        *func* is called without arguments every *interval* seconds,
+        and its result is assigned to the property named *target*
+        and/or passed to *callback*, which will receive this Gui instance
+        as the first argument and the result as the second.
+        Both happen in the GUI thread.
+
+        Calls are never overlapped: if a call takes longer than *interval*,
+        the missed ticks are skipped. If the GUI thread is busy,
+        only the newest result is delivered.
+
+        Returns a PollTask instance. Call its cancel() method to stop
+        polling. Polling stops automatically when the window is closed,
+        or when *func* raises an exception, which is then handled
+        according to the Gui exception mode.
+
+        Raises AttributeError if *target* is not a widget name.
+        '''
+        if not callable(func):
+            raise TypeError('func must be a callable')
+        if callback is not None and not callable(callback):
+            raise TypeError('callback must be a callable')
+        if interval <= 0:
+            raise ValueError('interval must be positive')
+        if target is not None:
+            self._build_name(target)
+            if target not in self._guietta_properties:
+                raise AttributeError(target)
+
+        def deliver(value):
+            if target is not None:
+                setattr(self, target, value)
+            if callback is not None:
+                _exception_wrapper(callback, self)(self, value)
+
+        task = PollTask(self)
+        coalescer = _Coalescer(task, deliver)
+        self._start_task(task, _poll_processing,
+                         (self, task, func, interval, coalescer))
+        return task
+
+    def _start_task(self, task, target, args):
+        task._thread = threading.Thread(target=target, args=args)
+        with self._tasks_lock:
+            self._tasks.add(task)
+        task._thread.start()
+
+    def _forget_task(self, task):
+        with self._tasks_lock:
+            self._tasks.discard(task)
+
+    def start_watchdog(self, threshold=0.5, interval=None, callback=None):
+        '''Start watching the event loop for stalls longer than
+        *threshold* seconds, and return the Watchdog instance.
+
+        Each stall is reported with the main thread stack and the
+        name of the slot that was running, either to *callback* in the
+        watchdog thread, or through the exception mode of this Gui.
+        Watching starts with the first heartbeat, so the watchdog can be
+        started before gui.run(). It is stopped when the window is closed.
+        '''
+        self.stop_watchdog()
+        self._watchdog = Watchdog(self, threshold, interval, callback)
+        return self._watchdog
+
+    def stop_watchdog(self):
+        '''Stop the watchdog, if running'''
+        if self._watchdog is not None:
+            self._watchdog.stop()
+            self._watchdog = None
+
+    def cancel_tasks(self, timeout=None):
+        '''Cancel all background tasks started by this Gui.
 
-        t = threading.Thread(target=_background_processing,
-                             args=(self, func, callback, *args))
-        t.start()
+        If *timeout* is not None, wait up to *timeout* seconds in total
+        for the background threads to terminate.
+        '''
+        with self._tasks_lock:
+            tasks = list(self._tasks)
+
+        for task in tasks:
+            task.cancel()
+
+        if timeout is not None:
+            deadline = time.monotonic() + timeout
+            for task in tasks:
+                task.join(max(0, deadline - time.monotonic()))
+
+    def extend(self, name, items):
+        '''Append *items* to the listbox or combobox *name*.
+
+        Only the new rows are created, without touching the existing ones.
+        For comboboxes, *items* can be either a sequence of
+        texts or a dictionary of text: data pairs.
+        '''
+        prop = self.proxy(name)
+        if not hasattr(prop, 'extend'):
+            raise TypeError('Widget %s does not support extend()' % name)
+        self.execute_in_main_thread(self._extend, prop, items)
+
+    def _extend(self, prop, items):
+        prop.extend(items)
+        prop.invalidate()
+        if prop.on_change is not None:
+            prop.on_change()
+
+    def append(self, name, item):
+        '''Append a single *item* to the listbox or combobox *name*'''
+        self.extend(name, [item])
 
     def enable_drag_and_drop(self, from_, to):
         '''Enable drag and drop between the two widgets'''
@@ -2471,6 +5418,9 @@ class Gui:
         if hasattr(widget, 'selectedItems'):
             return map(lambda x: x.text(), widget.selectedItems())
 
+        elif hasattr(widget, 'selectedIndexes'):
+            return map(lambda x: x.data(), widget.selectedIndexes())
+
         elif hasattr(widget, 'selectedText'):
             return widget.selectedText()
 
@@ -2488,6 +5438,15 @@ class Gui:
 
         Analyzes a function and auto-connects the function
         as a slot for all widgets that are accessed in the function itself.
+
+        Decorated functions are nodes of a dependency graph: a function
+        runs again when one of the widgets it reads fires its default
+        event, or when one of the properties it reads is assigned,
+        including by another auto function. All affected functions are
+        run once, in dependency order, at the next event loop iteration,
+        and are skipped if the values they read did not change since
+        their last run. The function receives the Gui and the arguments
+        of the latest widget signal that triggered it.
         '''
         source = inspect.getsource(func)
         tree = ast.parse(textwrap.dedent(source))
@@ -2495,12 +5454,17 @@ class Gui:
         analyzer = _Analyzer(decorator_name=Gui.auto.__name__)
         analyzer.visit(tree)
 
+        node = _AutoNode(func, analyzer.accessed_widgets,
+                         analyzer.assigned_widgets)
+        self._auto_graph.add(node)
+
         for widget_name in analyzer.accessed_widgets:
 
             if widget_name in self.widgets:
                 try:
                     widget = self.widgets[widget_name]
-                    connect(widget, slot=func)
+                    slot = functools.partial(self._auto_event, widget_name)
+                    connect(widget, slot=slot)
 
                 except ValueError:
                     # No default signal defined
@@ -2508,6 +5472,89 @@ class Gui:
 
         return func
 
+    def cached(self, func=None, *, maxsize=128, max_bytes=None):
+        '''Memoization decorator keyed on widget values::
+
+            @gui.cached(maxsize=32, max_bytes=100e6)
+            def spectrum(gui, *args):
+                return expensive_computation(gui.freq, gui.width)
+
+        The function code is analyzed like in *auto*, and its result is
+        stored using the values of the properties it reads as the key.
+        Calling it again when those values are the same as in a previous
+        call returns the stored result. Other arguments are not part
+        of the key. At most *maxsize* results are kept, and if *max_bytes*
+        is given, their total size (as reported by the *nbytes* attribute
+        for arrays or by sys.getsizeof otherwise) is kept below it,
+        discarding the least recently used ones first.
+
+        The decorated function has *cache_info()*, returning hits, misses
+        and current size, and *cache_clear()* methods.
+        '''
+        if func is None:
+            return functools.partial(self.cached, maxsize=maxsize,
+                                     max_bytes=max_bytes)
+
+        source = inspect.getsource(func)
+        tree = ast.parse(textwrap.dedent(source))
+
+        analyzer = _Analyzer(decorator_name=Gui.cached.__name__)
+        analyzer.visit(tree)
+        names = sorted(analyzer.accessed_widgets)
+
+        cache = _LRUCache(maxsize, max_bytes)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            keys = []
+            for name in names:
+                if name in self._guietta_properties:
+                    keys.append(_value_key(getattr(self, name)))
+
+            key = tuple(keys)
+            try:
+                hash(key)
+            except TypeError:
+                key = None
+            if key is None or None in keys:
+                cache.misses += 1
+                return func(*args, **kwargs)
+
+            sentinel = wrapper
+            result = cache.get(key, sentinel)
+            if result is sentinel:
+                result = func(*args, **kwargs)
+                cache.put(key, result)
+            return result
+
+        wrapper.cache_info = cache.info
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    def observe(self, names, callback):
+        '''Call *callback* when the value of any of the *names* properties
+        changes, either because of user interaction or of an assignment.
+
+        *names* can be a single name, an iterable of names or None
+        for all properties. Changes happening before the next event loop
+        iteration are collected into a single call
+        *callback(gui, changed)*, where *changed* is a frozenset with
+        the names of the properties that changed.
+
+        Returns a Subscription object, whose *unsubscribe()* method
+        stops the notifications.
+        '''
+        if isinstance(names, str):
+            names = frozenset([normalized(names)])
+        elif names is not None:
+            names = frozenset(normalized(name) for name in names)
+
+        return self._observers.add(names, callback)
+
+    def _auto_event(self, name, gui, *args):
+        '''Default event of a widget read by an auto function'''
+        self._auto_graph.invalidate(name, args)
+
     def add_as_subgui(self, subgui):
         '''
         Set *subgui* as a sub-gui of this one. Exception modes will be
@@ -2548,7 +5595,7 @@ class Gui:
                 return GuiettaProperty(get, set, self)
 
         self.widgets[name] = WidgetGroup(self, get_list, set_list)
-        self._align_guietta_properties()
+        self._add_property(name, self.widgets[name])
 
 
 class GuiIterator():
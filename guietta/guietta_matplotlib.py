@@ -4,10 +4,11 @@ from matplotlib.figure import Figure
 from matplotlib.colorbar import Colorbar
 from matplotlib.backends.backend_qt5agg import FigureCanvas
 
-from guietta import Signal, _alsoAcceptAnotherGui, Ax
+from guietta import Signal, _alsoAcceptAnotherGui, Ax, register_widget_type
+from guietta import ContextMixIn
 
 
-class MatplotlibWidget(FigureCanvas):
+class MatplotlibWidget(FigureCanvas, ContextMixIn):
 
     clicked = Signal(float, float)
 
@@ -90,4 +91,7 @@ class MatplotlibWidget(FigureCanvas):
 
         return (getx, setx)
 
+
+register_widget_type(MatplotlibWidget, default_signal='clicked')
+
 # ___oOo___
@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+
+from collections import OrderedDict
+
+import numpy as np
+
+from guietta import Qt, QTableView, QAbstractTableModel, QModelIndex
+from guietta import _alsoAcceptAnotherGui, GuiettaProperty, ContextMixIn
+from guietta import register_widget_type
+
+
+def _is_dataframe(data):
+    return hasattr(data, 'columns') and hasattr(data, 'iloc')
+
+
+def _columns_of(data):
+    '''Split a table into a list of 1d column arrays and their headers.
+
+    Record arrays and 2d arrays are split into views, without copies.
+    '''
+    if _is_dataframe(data):
+        headers = [str(c) for c in data.columns]
+        columns = [data.iloc[:, j].to_numpy() for j in range(len(headers))]
+        return columns, headers
+
+    arr = np.asarray(data)
+    if arr.dtype.names is not None:
+        return [arr[name] for name in arr.dtype.names], list(arr.dtype.names)
+
+    if arr.ndim == 1:
+        arr = arr[:, np.newaxis]
+    if arr.ndim != 2:
+        raise ValueError('Table data must be 2d, shape is %s instead' %
+                         str(arr.shape))
+    return [arr[:, j] for j in range(arr.shape[1])], \
+           [str(j) for j in range(arr.shape[1])]
+
+
+def _format_column(values, float_format):
+    '''Vectorized conversion of a column slice to strings'''
+
+    if values.dtype.kind in 'fc':
+        return np.char.mod(float_format, values).tolist()
+    return values.astype(str).tolist()
+
+
+class ArrayTableModel(QAbstractTableModel):
+    '''Read-only table model over a 2d array, record array or DataFrame.
+
+    Cells are converted to strings in blocks of *block_size* rows,
+    only when QT asks for them, and a few blocks are cached.
+    Sorting does not move the data: it uses an argsort permutation.
+    '''
+
+    block_size = 256
+    max_blocks = 64
+
+    def __init__(self, float_format='%g'):
+        super().__init__()
+        self._float_format = float_format
+        self._data = None
+        self._columns = []
+        self._headers = []
+        self._nrows = 0
+        self._order = None
+        self._inverse = None
+        self._sort_key = None
+        self._blocks = OrderedDict()
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return self._nrows
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._columns)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        nblock, offset = divmod(index.row(), self.block_size)
+        return self._block(nblock)[index.column()][offset]
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self._headers[section]
+        if self._order is not None:
+            section = int(self._order[section])
+        return str(section)
+
+    def _block(self, nblock):
+        '''Strings for a block of rows, as a list of columns'''
+
+        if nblock in self._blocks:
+            self._blocks.move_to_end(nblock)
+            return self._blocks[nblock]
+
+        start = nblock * self.block_size
+        stop = min(start + self.block_size, self._nrows)
+        if self._order is not None:
+            rows = self._order[start:stop]
+        else:
+            rows = slice(start, stop)
+
+        block = [_format_column(col[rows], self._float_format)
+                 for col in self._columns]
+
+        self._blocks[nblock] = block
+        if len(self._blocks) > self.max_blocks:
+            self._blocks.popitem(last=False)
+        return block
+
+    def table(self):
+        '''Returns the object that was last assigned'''
+        return self._data
+
+    def set_table(self, data):
+        '''Display a new table.
+
+        If the new table has the same shape and headers as the current one,
+        the view keeps its scroll position and sort order.
+        '''
+        columns, headers = _columns_of(data)
+        nrows = len(columns[0]) if columns else 0
+
+        if headers == self._headers and nrows == self._nrows:
+            self._data, self._columns = data, columns
+            self._blocks.clear()
+            if self._sort_key is not None:
+                self.sort(*self._sort_key)
+            self._emit_changed(0, nrows - 1)
+        else:
+            self.beginResetModel()
+            self._data, self._columns, self._headers = data, columns, headers
+            self._nrows = nrows
+            self._order = None
+            self._inverse = None
+            self._sort_key = None
+            self._blocks.clear()
+            self.endResetModel()
+
+    def update_rows(self, rows, values):
+        '''Overwrite some rows in place.
+
+        *rows* is an integer or a sequence of row numbers in the original
+        table, and *values* a sequence with one row of values
+        for each of them. Only the affected cells are redrawn. The sort order,
+        if any, is not recalculated.
+        '''
+        rows = np.atleast_1d(np.asarray(rows, dtype=int))
+        if _is_dataframe(values):
+            values = values.to_numpy()
+        values = np.asarray(values, dtype=object).reshape(len(rows), -1)
+
+        for j, col in enumerate(self._columns):
+            col[rows] = values[:, j]
+            if _is_dataframe(self._data):
+                self._data.iloc[rows, j] = values[:, j]
+
+        display_rows = self._display_rows(rows)
+        for nblock in set((display_rows // self.block_size).tolist()):
+            self._blocks.pop(nblock, None)
+        self._emit_changed(int(display_rows.min()), int(display_rows.max()))
+
+    def _display_rows(self, rows):
+        '''Display positions of the original *rows*.
+
+        The inverse of the sort permutation is computed once per sort.
+        '''
+        if self._order is None:
+            return rows
+        if self._inverse is None:
+            self._inverse = np.empty_like(self._order)
+            self._inverse[self._order] = np.arange(len(self._order))
+        return self._inverse[rows]
+
+    def _emit_changed(self, first, last):
+        if last >= first and self._columns:
+            self.dataChanged.emit(self.index(first, 0),
+                                  self.index(last, len(self._columns) - 1))
+            self.headerDataChanged.emit(Qt.Vertical, first, last)
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        if not 0 <= column < len(self._columns):
+            return
+        self.layoutAboutToBeChanged.emit()
+        keys = self._columns[column]
+        try:
+            perm = np.argsort(keys, kind='stable')
+        except TypeError:
+            perm = np.argsort(keys.astype(str), kind='stable')
+        if order == Qt.DescendingOrder:
+            perm = perm[::-1]
+        self._order = perm
+        self._inverse = None
+        self._sort_key = (column, order)
+        self._blocks.clear()
+        self.layoutChanged.emit()
+
+
+class TableWidget(QTableView, ContextMixIn):
+    '''Table view whose guietta property is the displayed table.
+
+    Reading the property returns the last assigned object.
+    '''
+
+    def __init__(self, float_format='%g'):
+        super().__init__()
+        self.setModel(ArrayTableModel(float_format))
+        self.setSortingEnabled(True)
+        self.sortByColumn(-1, Qt.AscendingOrder)   # Start unsorted
+
+    def update_rows(self, rows, values):
+        '''Overwrite some rows in place, see ArrayTableModel.update_rows()'''
+        self.model().update_rows(rows, values)
+
+    def __guietta_property__(self):
+
+        def get_table():
+            return self.model().table()
+
+        @_alsoAcceptAnotherGui(self)
+        def set_table(data):
+            self.model().set_table(data)
+
+        return GuiettaProperty(get_table, set_table, self)
+
+
+register_widget_type(TableWidget, default_signal='clicked')
+
+# ___oOo___
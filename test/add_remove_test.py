@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+from guietta.guietta import Gui, _, ___, HS
+
+from PySide2.QtWidgets import QLabel
+
+
+class AddRemoveTest(unittest.TestCase):
+
+    def setUp(self):
+        self.gui = Gui(['a', 'b', 'c'],
+                       ['d', 'e', 'f'])
+
+    def test_add_row(self):
+        props_before = dict(self.gui._guietta_properties)
+        names = self.gui.add_row([HS('ch1'), '__val1__', _])
+        assert names == ['ch1', 'val1']
+        assert self.gui[2, 0] is self.gui.widgets['ch1']
+        self.gui.ch1 = 5
+        assert self.gui.ch1 == 5
+
+        # Existing properties were not rebuilt
+        for name, prop in props_before.items():
+            assert self.gui.proxy(name) is prop
+
+    def test_add_row_expand(self):
+        self.gui.add_row(['long'])
+        assert self.gui.layout().getItemPosition(
+            self.gui.layout().indexOf(self.gui.widgets['long']))[3] == 3
+
+    def test_insert_row_moves_following(self):
+        self.gui.add_row(['x', 'y', 'z'], index=1)
+        assert self.gui[1, 0] is self.gui.widgets['x']
+        assert self.gui[2, 0] is self.gui.widgets['d']
+        assert len(self.gui._rows) == 3
+
+    def test_insert_and_remove(self):
+        widget = self.gui.remove('e')
+        assert 'e' not in self.gui.widgets
+        assert not hasattr(self.gui, 'e')
+        assert self.gui.layout().itemAtPosition(1, 1) is None
+        assert widget.parent() is None
+        assert not hasattr(widget, '_gui')
+
+        name = self.gui.insert(1, 1, '__new__')
+        assert name == 'new'
+        assert self.gui[1, 1] is self.gui.widgets['new']
+        self.gui.new = 'foo'
+        assert self.gui.new == 'foo'
+
+    def test_insert_row_moves_only_following(self):
+        layout = self.gui.layout()
+        removed = []
+        orig = layout.takeAt
+        layout.takeAt = lambda k: (removed.append(layout.itemAt(k).widget()),
+                                   orig(k))[1]
+        self.gui.add_row(['x', 'y', 'z'], index=1)
+        assert set(removed) == {self.gui.widgets[n] for n in 'def'}
+        assert self.gui[2, 2] is self.gui.widgets['f']
+
+        del removed[:]
+        self.gui.add_row(['t', 'u', 'v'])
+        assert removed == []
+        assert self.gui[3, 0] is self.gui.widgets['t']
+
+    def test_insert_row_moves_subgui(self):
+        subgui = Gui(['sub'])
+        self.gui.e = subgui
+        self.gui.add_row(['x', 'y', 'z'], index=0)
+        assert self.gui[2, 1] is subgui.window()
+
+    def test_direct_layout_edits(self):
+        layout = self.gui.layout()
+        self.gui.remove('e')
+        extra = QLabel('extra')
+        layout.addWidget(extra, 1, 1)
+        self.gui.add_row(['x', 'y', 'z'], index=1)
+        assert self.gui[2, 1] is extra
+        assert self.gui[2, 0] is self.gui.widgets['d']
+
+        layout.removeWidget(self.gui.widgets['a'])
+        self.gui.remove('b')
+        self.gui.remove('f')
+        assert self.gui[2, 1] is extra
+        assert layout.itemAtPosition(2, 2) is None
+        self.gui.insert(0, 1, 'new')
+        assert self.gui[0, 1] is self.gui.widgets['new']
+        assert self.gui[2, 0] is self.gui.widgets['d']
+
+    def test_insert_occupied(self):
+        with self.assertRaises(ValueError):
+            self.gui.insert(0, 0, 'x')
+
+    def test_insert_new_row(self):
+        self.gui.insert(3, 2, 'far')
+        assert len(self.gui._rows) == 4
+        assert self.gui[3, 2] is self.gui.widgets['far']
+
+    def test_rename_keeps_other_properties(self):
+        prop = self.gui.proxy('b')
+        self.gui.rename(['x', _, _])
+        assert self.gui.proxy('b') is prop
+        assert self.gui.x == 'a'
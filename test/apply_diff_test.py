@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+import random
+import unittest
+from guietta.guietta import _apply_diff, Gui, LB, CB
+
+
+class ApplyDiffTest(unittest.TestCase):
+
+    def check(self, old, new):
+        result = list(old)
+        ops = []
+
+        def replace(i, j):
+            ops.append('replace')
+            result[i] = new[j]
+
+        def insert(i, j1, j2):
+            ops.append('insert')
+            result[i:i] = new[j1:j2]
+
+        def remove(i, n):
+            ops.append('remove')
+            del result[i:i + n]
+
+        _apply_diff(old, new, replace, insert, remove)
+        assert result == new
+        return ops
+
+    def test_no_change(self):
+        assert self.check(['a', 'b'], ['a', 'b']) == []
+
+    def test_append(self):
+        assert self.check(['a', 'b'], ['a', 'b', 'c', 'd']) == ['insert']
+
+    def test_single_change(self):
+        old = [str(x) for x in range(1000)]
+        new = list(old)
+        new[500] = 'foo'
+        assert self.check(old, new) == ['replace']
+
+    def test_random(self):
+        rnd = random.Random(1234)
+        for _ in range(100):
+            old = [rnd.choice('abcde') for _ in range(rnd.randint(0, 20))]
+            new = [rnd.choice('abcde') for _ in range(rnd.randint(0, 20))]
+            self.check(old, new)
+
+
+class IncrementalWidgetsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.gui = Gui([LB('list'), CB('combo', ['a', 'b'])])
+
+    def test_listbox_keeps_selection(self):
+        self.gui.list = ['a', 'b', 'c']
+        widget = self.gui.widgets['list']
+        item = widget.item(1)
+        widget.setCurrentRow(1)
+        self.gui.list = ['x', 'a', 'b', 'c', 'd']
+        assert widget.item(2) is item
+        assert widget.currentRow() == 2
+        assert self.gui.list == ['x', 'a', 'b', 'c', 'd']
+
+    def test_listbox_extend(self):
+        self.gui.list = ['a']
+        self.gui.extend('list', ['b', 'c'])
+        self.gui.append('list', 'd')
+        assert self.gui.list == ['a', 'b', 'c', 'd']
+
+    def test_listbox_external_change(self):
+        self.gui.list = ['a']
+        self.gui.widgets['list'].addItem('b')
+        assert self.gui.list == ['a', 'b']
+
+    def test_combobox(self):
+        self.gui.combo = {'a': 1, 'b': 2, 'c': 3}
+        self.gui.combo = {'a': 1, 'c': 4}
+        assert self.gui.combo == {'a': 1, 'c': 4}
+        self.gui.extend('combo', {'d': 5})
+        self.gui.append('combo', 'e')
+        assert self.gui.combo == {'a': 1, 'c': 4, 'd': 5, 'e': None}
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+from guietta.guietta import Gui, HS, _
+
+
+class AutoGraphTest(unittest.TestCase):
+
+    def setUp(self):
+        self.gui = Gui(['__num__', 'double', 'quad'])
+        self.calls = []
+
+    def _process(self):
+        self.gui._app.processEvents()
+
+    def _define(self):
+        gui = self.gui
+        calls = self.calls
+
+        # Registered first, but depends on the other one
+        @gui.auto
+        def quadruple(gui, *args):
+            calls.append('quad')
+            gui.quad = str(int(gui.double) * 2)
+
+        @gui.auto
+        def double(gui, *args):
+            calls.append('double')
+            gui.double = str(int(gui.num) * 2)
+
+    def test_chain_in_order(self):
+        self._define()
+        self.gui.num = '3'
+        self._process()
+        assert self.calls == ['double', 'quad']
+        assert self.gui.quad == '12'
+
+    def test_coalesced(self):
+        self._define()
+        self.gui.num = '1'
+        self.gui.num = '2'
+        self.gui.num = '3'
+        self._process()
+        assert self.calls == ['double', 'quad']
+        assert self.gui.quad == '12'
+
+    def test_memoized(self):
+        self._define()
+        self.gui.num = '3'
+        self._process()
+        del self.calls[:]
+
+        self.gui.widgets['num'].returnPressed.emit()
+        self._process()
+        assert self.calls == []
+        assert self.gui._auto_graph.nodes[1].skipped == 1
+
+    def test_unchanged_output_stops_chain(self):
+        self._define()
+        self.gui.num = '3'
+        self._process()
+        del self.calls[:]
+
+        # The function runs, but its output does not change
+        self.gui.num = '03'
+        self._process()
+        assert self.calls == ['double']
+
+
+class AutoGraphArgsTest(unittest.TestCase):
+
+    def test_value_flows_with_signal_args(self):
+        gui = Gui([HS('slider'), 'double', 'quad'])
+        received = []
+
+        @gui.auto
+        def double(gui, *args):
+            received.append(args)
+            gui.double = str(gui.slider * 2)
+
+        @gui.auto
+        def quadruple(gui, *args):
+            gui.quad = str(int(gui.double) * 2)
+
+        gui.widgets['slider'].setValue(5)
+        gui._app.processEvents()
+        assert received == [(5,)]
+        assert gui.double == '10'
+        assert gui.quad == '20'
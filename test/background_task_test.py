@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+from guietta.guietta import Gui, current_task
+
+from PySide2.QtWidgets import QApplication
+
+
+class BackgroundTaskTest(unittest.TestCase):
+
+    def setUp(self):
+        self.gui = Gui(['label'])
+
+    def test_callback(self):
+        results = []
+        task = self.gui.execute_in_background(lambda x: x + 1, args=(1,),
+                                              callback=lambda gui, x: results.append(x))
+        task.join()
+        QApplication.instance().processEvents()
+        assert results == [2]
+
+    def test_cooperative_cancel(self):
+
+        def job():
+            task = current_task()
+            while not task.sleep(0.01):
+                pass
+            return 'cancelled'
+
+        results = []
+        task = self.gui.execute_in_background(job, callback=lambda gui, x: results.append(x))
+        assert task.is_alive()
+        self.gui.cancel_tasks(timeout=5)
+        assert not task.is_alive()
+        QApplication.instance().processEvents()
+        assert task.cancelled
+        assert results == []
+
+    def test_cancel_on_close(self):
+        self.gui.show()
+        task = self.gui.execute_in_background(lambda: current_task().sleep(10))
+        self.gui.close()
+        assert task.cancelled
+        assert not task.is_alive()
+
+    def test_finished_before_close(self):
+        self.gui.show()
+        results = []
+        task = self.gui.execute_in_background(lambda: 1,
+                                              callback=lambda gui, x: results.append(x))
+        task.join()
+        self.gui.close()
+        QApplication.instance().processEvents()
+        assert task.cancelled
+        assert results == []
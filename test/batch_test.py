@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+import threading
+from guietta.guietta import Gui, _dispatcher, _post_to_main_thread
+
+from PySide2.QtWidgets import QLabel
+
+
+class BatchTest(unittest.TestCase):
+
+    def setUp(self):
+        self.gui = Gui([(QLabel(''), 'a'), (QLabel(''), 'b')])
+
+    def test_deferred_and_coalesced(self):
+        calls = []
+        widget = self.gui.widgets['a']
+        orig = widget.setText
+        widget.setText = lambda text: (calls.append(text), orig(text))
+
+        with self.gui.batch():
+            self.gui.a = 'foo'
+            self.gui.a = 'bar'
+            self.gui.b = 'baz'
+            assert self.gui.a == ''
+            assert not self.gui.window().updatesEnabled()
+
+        assert calls == ['bar']
+        assert self.gui.a == 'bar'
+        assert self.gui.b == 'baz'
+        assert self.gui.window().updatesEnabled()
+
+    def test_thread_assignments(self):
+        with self.gui.batch():
+            t = threading.Thread(target=lambda: setattr(self.gui, 'a', 'thread'))
+            t.start()
+            t.join()
+        assert self.gui.a == 'thread'
+
+    def test_drain_respects_budget(self):
+        dispatcher = _dispatcher()
+        dispatcher.drain()
+        n = dispatcher.max_calls * 2
+        with self.gui.batch():
+            for i in range(n):
+                _post_to_main_thread(lambda: None, ())
+        assert dispatcher.queue_depth() == n - dispatcher.max_calls
+        dispatcher.drain()
+
+    def test_nested(self):
+        with self.gui.batch():
+            with self.gui.batch():
+                self.gui.a = 'foo'
+            assert self.gui.a == ''
+        assert self.gui.a == 'foo'
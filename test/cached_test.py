@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+from guietta.guietta import Gui, HS
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class CachedTest(unittest.TestCase):
+
+    def setUp(self):
+        self.gui = Gui([HS('slider'), '__name__'])
+        self.calls = 0
+
+    def test_hits_and_misses(self):
+        gui = self.gui
+
+        @gui.cached(maxsize=2)
+        def compute(gui, *args):
+            self.calls += 1
+            return gui.slider * 10
+
+        gui.slider = 1
+        assert compute(gui) == 10
+        gui.slider = 2
+        assert compute(gui) == 20
+        gui.slider = 1
+        assert compute(gui) == 10
+        assert self.calls == 2
+
+        info = compute.cache_info()
+        assert info.hits == 1
+        assert info.misses == 2
+        assert info.currsize == 2
+
+    def test_lru_eviction(self):
+        gui = self.gui
+
+        @gui.cached(maxsize=2)
+        def compute(gui):
+            self.calls += 1
+            return gui.slider
+
+        for value in (1, 2, 3, 1):
+            gui.slider = value
+            compute(gui)
+        assert self.calls == 4
+        assert compute.cache_info().currsize == 2
+
+    def test_bare_decorator_and_clear(self):
+        gui = self.gui
+
+        @gui.cached
+        def compute(gui):
+            self.calls += 1
+            return gui.name + '!'
+
+        gui.name = 'foo'
+        assert compute(gui) == 'foo!'
+        assert compute(gui) == 'foo!'
+        assert self.calls == 1
+        compute.cache_clear()
+        compute(gui)
+        assert self.calls == 2
+
+    @unittest.skipIf(np is None, 'numpy not installed')
+    def test_max_bytes(self):
+        gui = self.gui
+
+        @gui.cached(maxsize=None, max_bytes=8 * 1000 * 2)
+        def compute(gui):
+            return np.full(1000, gui.slider, dtype=np.float64)
+
+        for value in range(5):
+            gui.slider = value
+            compute(gui)
+        info = compute.cache_info()
+        assert info.currsize == 2
+        assert info.nbytes == 16000
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+import time
+import unittest
+import threading
+from concurrent.futures import TimeoutError
+from guietta.guietta import Gui
+
+from PySide2.QtWidgets import QApplication
+
+
+class CallInMainThreadTest(unittest.TestCase):
+
+    def setUp(self):
+        self.gui = Gui(['label'])
+
+    def process_events_until(self, condition, timeout=5):
+        app = QApplication.instance()
+        deadline = time.time() + timeout
+        while not condition() and time.time() < deadline:
+            app.processEvents()
+
+    def test_main_thread_is_immediate(self):
+        future = self.gui.call_in_main_thread(lambda x: x * 2, 21)
+        assert future.done()
+        assert future.result() == 42
+
+    def test_from_worker_thread(self):
+        results = []
+
+        def worker():
+            future = self.gui.call_in_main_thread(threading.get_ident)
+            results.append(future.result(timeout=5))
+
+        t = threading.Thread(target=worker)
+        t.start()
+        self.process_events_until(lambda: not t.is_alive())
+        t.join()
+        assert results == [threading.get_ident()]
+
+    def test_exception_is_propagated(self):
+        future = self.gui.call_in_main_thread(lambda: 1 / 0)
+        with self.assertRaises(ZeroDivisionError):
+            future.result()
+
+    def test_timeout_cancels_call(self):
+        calls = []
+        futures = []
+
+        def worker():
+            futures.append(self.gui.call_in_main_thread(calls.append, 1))
+            try:
+                futures[0].result(timeout=0.01)
+            except TimeoutError:
+                pass
+
+        t = threading.Thread(target=worker)
+        t.start()
+        t.join()
+        QApplication.instance().processEvents()
+        assert futures[0].cancelled()
+        assert calls == []
+
+    def test_deadlock_detection(self):
+        futures = []
+        t = threading.Thread(target=lambda: futures.append(
+                             self.gui.call_in_main_thread(int)))
+        t.start()
+        t.join()
+        with self.assertRaises(RuntimeError):
+            futures[0].result()
+        QApplication.instance().processEvents()
+        assert futures[0].result() == 0
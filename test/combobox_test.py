@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+from guietta.guietta import Gui, CB
+
+
+class ComboBoxTest(unittest.TestCase):
+
+    def setUp(self):
+        self.ids = ['ID%05d' % i for i in range(50000)]
+        self.gui = Gui([CB('combo', {'a': 1, 'b': 2}),
+                        CB('search', self.ids, searchable=True)])
+
+    def test_get_set(self):
+        assert self.gui.combo == {'a': 1, 'b': 2}
+        self.gui.combo = {'x': 'foo', 'b': 3}
+        assert self.gui.combo == {'x': 'foo', 'b': 3}
+        assert self.gui.widgets['combo'].itemData(1) == 3
+
+    def test_incremental_update(self):
+        model = self.gui.widgets['search'].model()
+        signals = []
+        model.modelReset.connect(lambda: signals.append('reset'))
+        model.rowsInserted.connect(lambda *args: signals.append('insert'))
+        model.rowsRemoved.connect(lambda *args: signals.append('remove'))
+        self.gui.search = dict.fromkeys(self.ids + ['new'])
+        assert signals == ['insert']
+        assert list(self.gui.search)[-1] == 'new'
+        self.gui.search = dict.fromkeys(self.ids[:100] + self.ids[101:])
+        assert signals == ['insert', 'remove']
+        assert len(self.gui.search) == 49999
+
+    def test_keeps_current_text(self):
+        widget = self.gui.widgets['combo']
+        widget.setCurrentIndex(1)
+        self.gui.combo = {'c': 0, 'd': 0, 'b': 0}
+        assert widget.currentText() == 'b'
+
+    def test_replace_all_selects_first(self):
+        widget = self.gui.widgets['combo']
+        widget.setCurrentIndex(1)
+        self.gui.combo = {'x': 0, 'y': 0}
+        assert widget.currentIndex() == 0
+        assert widget.currentText() == 'x'
+
+    def test_qcombobox_methods(self):
+        widget = self.gui.widgets['combo']
+        widget.addItem('c', 3)
+        widget.removeItem(0)
+        assert self.gui.combo == {'b': 2, 'c': 3}
+        assert widget.currentText() == 'b'
+
+    def test_getter_is_cached(self):
+        model = self.gui.widgets['search'].model()
+        self.gui.search
+        cached = model.as_dict()
+        self.gui.search
+        assert model.as_dict() is cached
+        self.gui.extend('search', ['new'])
+        assert model.as_dict() is not cached
+        assert len(self.gui.search) == 50001
+
+    def test_prefix_search(self):
+        model = self.gui.widgets['search'].model()
+        assert model.starting_with('id001', 100) == \
+            ['ID%05d' % i for i in range(100, 200)]
+        assert model.starting_with('ID4999', 3) == \
+            ['ID49990', 'ID49991', 'ID49992']
+        assert model.starting_with('nothing', 10) == []
+
+    def test_completer_popup(self):
+        widget = self.gui.widgets['search']
+        completer = widget.completer()
+        completer._update('ID4999')
+        assert completer.model().stringList() == \
+            ['ID4999%d' % i for i in range(10)]
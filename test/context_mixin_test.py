@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+from guietta.guietta import Gui, ContextMixIn
+
+from PySide2.QtWidgets import QLabel, QLineEdit, QPushButton
+
+
+class MyEdit(QLineEdit):
+    pass
+
+
+class MyButton(QPushButton):
+
+    def __enter__(self):
+        return 'mine'
+
+    def __exit__(self, *args):
+        return False
+
+
+class ContextMixInTest(unittest.TestCase):
+
+    def test_qt_class_shared(self):
+        a, b = QLabel('a'), QLabel('b')
+        Gui([(a, 'a'), (b, 'b')]).window()
+        assert isinstance(a, ContextMixIn)
+        assert type(a) is type(b)
+
+    def test_user_class_not_replaced(self):
+        edit = MyEdit('edit')
+        nclasses = len(ContextMixIn.__subclasses__())
+        Gui([(edit, 'edit')]).window()
+        assert type(edit) is MyEdit
+        assert vars(MyEdit)['__enter__'] is ContextMixIn.__enter__
+        assert len(ContextMixIn.__subclasses__()) == nclasses
+
+    def test_user_methods_kept(self):
+        button = MyButton('button')
+        gui = Gui([button])
+        assert type(button) is MyButton
+        with gui.widgets['button'] as value:
+            pass
+        assert value == 'mine'
+
+    def test_added_methods_not_replaced(self):
+        class MyEdit2(QLineEdit):
+            pass
+        MyEdit2.__exit__ = lambda self, *args: False
+        Gui([(MyEdit2('edit'), 'edit')]).window()
+        assert '__enter__' not in vars(MyEdit2)
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+import threading
+from guietta.guietta import _dispatcher, dispatcher_stats, Priority
+
+from PySide2.QtWidgets import QApplication
+
+
+class DispatcherTest(unittest.TestCase):
+
+    def post_from_thread(self, calls):
+        def worker():
+            for callback, args, priority in calls:
+                _dispatcher().post(callback, args, priority)
+        t = threading.Thread(target=worker)
+        t.start()
+        t.join()
+
+    def test_priority_lanes(self):
+        order = []
+        self.post_from_thread([(order.append, ('bulk',), Priority.BULK),
+                               (order.append, ('int1',), Priority.INTERACTIVE),
+                               (order.append, ('int2',), Priority.INTERACTIVE)])
+        QApplication.instance().processEvents()
+        assert order == ['int1', 'int2', 'bulk']
+
+    def test_single_wakeup(self):
+        results = []
+        before = dispatcher_stats()
+        n = 50
+        self.post_from_thread([(results.append, (i,), Priority.INTERACTIVE)
+                               for i in range(n)])
+        QApplication.instance().processEvents()
+        after = dispatcher_stats()
+        assert results == list(range(n))
+        assert after.dispatched - before.dispatched == n
+        assert after.wakeups - before.wakeups == 1
+        assert after.queue_depth == 0
+
+    def test_drain_limit(self):
+        results = []
+        dispatcher = _dispatcher()
+        self.post_from_thread([(results.append, (i,), Priority.BULK)
+                               for i in range(10)])
+        dispatcher.drain(max_calls=3)
+        assert results == [0, 1, 2]
+        QApplication.instance().processEvents()
+        assert results == list(range(10))
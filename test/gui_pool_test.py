@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+
+import gc
+import time
+import unittest
+import weakref
+from guietta.guietta import Gui, GuiPool, HS
+from PySide2.QtCore import QEvent
+
+
+class GuiPoolTest(unittest.TestCase):
+
+    def setUp(self):
+        self.built = 0
+
+    def _make(self):
+        self.built += 1
+        return Gui(['Confirm?', '__note__:default', HS('level')])
+
+    def test_reuse_and_reset(self):
+        pool = GuiPool(self._make)
+        gui = pool.acquire()
+        gui.show()
+        gui.note = 'changed'
+        gui.level = 42
+        gui.close()
+
+        gui2 = pool.acquire()
+        assert gui2 is gui
+        assert self.built == 1
+        assert gui2.note == 'default'
+        assert gui2.level == 0
+        assert pool.stats().reused == 1
+
+    def test_maxsize(self):
+        pool = GuiPool(self._make, maxsize=1)
+        guis = [pool.acquire() for i in range(3)]
+        for gui in guis:
+            gui.show()
+            gui.close()
+
+        stats = pool.stats()
+        assert stats.created == 3
+        assert stats.pooled == 1
+        assert stats.discarded == 2
+        # SmartQLabel has two inner labels
+        assert stats.pooled_widgets == 5
+
+    def test_max_widgets(self):
+        pool = GuiPool(self._make, maxsize=10, max_widgets=8)
+        guis = [pool.acquire() for i in range(2)]
+        for gui in guis:
+            gui.show()
+            gui.close()
+        assert pool.stats().pooled == 1
+
+    def test_clear(self):
+        pool = GuiPool(self._make)
+        gui = pool.acquire()
+        gui.show()
+        gui.close()
+        pool.clear()
+        assert pool.stats().pooled == 0
+        assert pool.acquire() is not gui
+        assert pool.stats().discarded == 1
+
+    def _run_events(self, gui, seconds):
+        end = time.perf_counter() + seconds
+        while time.perf_counter() < end:
+            gui._app.processEvents()
+
+    def test_timers_restarted(self):
+        ticks = []
+
+        def make():
+            gui = self._make()
+            gui.timer_start(lambda gui: ticks.append(1), 0.01, name='tick')
+            return gui
+
+        pool = GuiPool(make)
+        gui = pool.acquire()
+        gui.show()
+        gui.timer_start(lambda gui: None, 0.01, name='extra')
+        gui.observe(None, lambda gui, names: None)
+        gui.close()
+        assert gui._observers.subscriptions == []
+
+        gui2 = pool.acquire()
+        assert gui2 is gui
+        del ticks[:]
+        self._run_events(gui2, 0.05)
+        assert len(ticks) > 0
+        assert gui2.timer_count('extra') == 0
+        gui2.close()
+
+    def test_destroyed_not_reused(self):
+        pool = GuiPool(self._make)
+        gui = pool.acquire()
+        gui.show()
+        gui.close()
+        gui.destroy()
+
+        gui2 = pool.acquire()
+        assert gui2 is not gui
+        assert self.built == 2
+        stats = pool.stats()
+        assert stats.discarded == 1
+        assert stats.pooled_widgets == 0
+
+    def test_deleted_window_not_reused(self):
+        pool = GuiPool(self._make)
+        gui = pool.acquire()
+        gui.show()
+        gui.close()
+        gui.window().deleteLater()
+        gui._app.sendPostedEvents(None, QEvent.DeferredDelete)
+
+        assert pool.acquire() is not gui
+        assert pool.stats().discarded == 1
+
+    def test_destroy_acquired(self):
+        pool = GuiPool(self._make)
+        gui = pool.acquire()
+        gui.show()
+        gui.destroy()
+        app = gui._app
+        ref = weakref.ref(gui)
+        del gui
+        app.sendPostedEvents(None, QEvent.DeferredDelete)
+        gc.collect()
+
+        assert ref() is None
+        stats = pool.stats()
+        assert stats.discarded == 1
+        assert stats.pooled == 0
+        assert pool._entries == {}
+
+    def test_destroy_pooled(self):
+        pool = GuiPool(self._make)
+        gui = pool.acquire()
+        gui.show()
+        gui.close()
+        gui.destroy()
+
+        stats = pool.stats()
+        assert stats.pooled == 0
+        assert stats.pooled_widgets == 0
+        assert pool._entries == {}
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from guietta.guietta import Gui, _ImageIndex, _image_fullpath
+
+
+class ImageIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        open(os.path.join(self.dir, 'up.png'), 'wb').close()
+        open(os.path.join(self.dir, 'notes.txt'), 'wb').close()
+        self.gui = Gui(['Result:'], images_dir=self.dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_lookup(self):
+        assert _image_fullpath(self.gui, 'up.png') == \
+            (os.path.join(self.dir, 'up.png'), 'up')
+        assert _image_fullpath(self.gui, 'down.png') == (None, 'down')
+        assert _image_fullpath(self.gui, 'notes.txt') == (None, 'notes')
+
+    def test_text_does_not_stat(self):
+        with mock.patch('os.path.exists') as exists:
+            assert _image_fullpath(self.gui, 'Result:') == (None, 'Result:')
+            assert _image_fullpath(self.gui, 'up.png')[0] is not None
+            exists.assert_not_called()
+
+    def test_new_file_found(self):
+        open(os.path.join(self.dir, 'later.jpg'), 'wb').close()
+        assert _image_fullpath(self.gui, 'later.jpg')[0] is not None
+
+    def test_refresh(self):
+        index = _ImageIndex(self.dir)
+        os.remove(os.path.join(self.dir, 'up.png'))
+        index.refresh()
+        assert index.fullpath('up.png') is None
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+from guietta.guietta import Gui, LazyGui, TABS
+
+
+class LazyGuiTest(unittest.TestCase):
+
+    def setUp(self):
+        self.built = []
+
+    def _factory(self, name):
+        def make():
+            self.built.append(name)
+            return Gui(['__%s__' % name])
+        return make
+
+    def _process(self, gui):
+        gui._app.processEvents()
+
+    def test_built_on_show(self):
+        gui = Gui([LazyGui(self._factory('a'), size_hint=(200, 100),
+                           name='settings')])
+        widget = gui.widgets['settings']
+        assert self.built == []
+        assert widget.sizeHint().width() == 200
+
+        gui.window().show()
+        self._process(gui)
+        assert self.built == ['a']
+        gui.window().close()
+
+    def test_ensure_built(self):
+        gui = Gui([LazyGui(self._factory('a'), name='settings')])
+        assert gui.settings is None
+        gui.widgets['settings'].ensure_built().a = 'foo'
+        assert self.built == ['a']
+        assert gui.settings.a == 'foo'
+
+    def test_tabs(self):
+        eager = Gui(['__x__'])
+        pages = [('first', self._factory('one')),
+                 ('second', self._factory('two')),
+                 ('third', eager)]
+        gui = Gui([TABS('tabs', pages, size_hint=(300, 200))])
+        gui.window().show()
+        self._process(gui)
+        assert self.built == ['one']
+
+        gui.tabs = 'second'
+        self._process(gui)
+        assert gui.tabs == 'second'
+        assert self.built == ['one', 'two']
+        assert gui.widgets['tabs'].page('third') is eager
+
+        gui.widgets['tabs'].page(0).one = 'bar'
+        assert self.built == ['one', 'two']
+        gui.window().close()
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+import gc
+import os
+import unittest
+
+from guietta.guietta import Gui, HS, LB, WB, T, Led, _, live_guis, _guis
+from guietta.guietta import ContextMixIn
+from PySide2.QtCore import QCoreApplication, QEvent
+from PySide2.QtWidgets import QApplication
+
+
+def _rss():
+    '''Resident memory in bytes'''
+    with open('/proc/self/statm') as f:
+        return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+
+
+def _delete_later():
+    QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+
+
+@unittest.skipUnless(os.path.exists('/proc/self/statm'), 'needs /proc')
+class LeakTest(unittest.TestCase):
+
+    def _cycle(self, n, persistent, subclasses=False):
+        persistence = Gui.PERSISTENT if persistent else Gui.DYNAMIC
+        for i in range(n):
+            if subclasses:
+                rows = ([LB('list'), WB('bank', HS, 4), (Led(), 'led')],
+                        [T('table'), ['Go'], _])
+            else:
+                rows = ([['Go'], _, _],)
+            gui = Gui(['label', '__edit__', HS('slider')], *rows,
+                      persistence=persistence)
+            gui.window()
+            gui.timer_start(lambda gui: None, name='t%d' % i)
+            gui.destroy()
+            if i % 100 == 0:
+                _delete_later()
+        _delete_later()
+        gc.collect()
+
+    def test_destroy_releases_everything(self):
+        gui = Gui(['label', '__edit__'])
+        gui.destroy()
+        _delete_later()
+        gc.collect()
+        assert gui not in live_guis()
+        assert id(gui) not in _guis
+        assert gui.widgets == {}
+
+    def test_bounded_memory(self):
+        self._cycle(1000, persistent=True)
+        nguis = len(live_guis())
+        nwidgets = len(QApplication.allWidgets())
+        before = _rss()
+        self._cycle(5000, persistent=True)
+        self._cycle(5000, persistent=False)
+        growth = _rss() - before
+
+        assert len(live_guis()) == nguis
+        assert len(QApplication.allWidgets()) == nwidgets
+        assert growth < 50 * 1024 * 1024, growth
+
+    def test_subclass_widgets_bounded(self):
+        # Qt's own deletion cost grows with the number of item views
+        # ever created, so fewer cycles than above.
+        self._cycle(200, persistent=True, subclasses=True)
+        nguis = len(live_guis())
+        nwidgets = len(QApplication.allWidgets())
+        nclasses = len(ContextMixIn.__subclasses__())
+        before = _rss()
+        self._cycle(500, persistent=True, subclasses=True)
+        self._cycle(500, persistent=False, subclasses=True)
+        growth = _rss() - before
+
+        assert len(live_guis()) == nguis
+        assert len(QApplication.allWidgets()) == nwidgets
+        assert len(ContextMixIn.__subclasses__()) == nclasses
+        assert growth < 50 * 1024 * 1024, growth
+
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+from guietta.guietta import Gui, Led, LM
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class LedTest(unittest.TestCase):
+
+    def test_palette_switch(self):
+        led = Led()
+        assert led.styleSheet() == ''
+        off_color = led.palette().windowText().color()
+        led.on()
+        assert led._state is True
+        assert led.palette().windowText().color() != off_color
+        led.off()
+        assert led.palette().windowText().color() == off_color
+
+
+@unittest.skipIf(np is None, 'numpy not installed')
+class LedMatrixTest(unittest.TestCase):
+
+    def setUp(self):
+        self.gui = Gui([LM('status', (16, 32), colors=('gray', 'green', 'red'))])
+
+    def test_shape(self):
+        assert self.gui.status.shape == (16, 32)
+        assert (self.gui.status == 0).all()
+
+    def test_set_get(self):
+        state = np.zeros((16, 32), dtype=int)
+        state[3, 4] = 2
+        self.gui.status = state
+        assert self.gui.status[3, 4] == 2
+        self.gui.status[3, 4] = 0
+        assert self.gui.status[3, 4] == 2
+
+    def test_in_place_edit(self):
+        widget = self.gui.widgets['status']
+        updates = []
+        widget.update = lambda rect: updates.append(rect)
+        state = np.zeros((16, 32), dtype=int)
+        state[0, 0] = 1
+        self.gui.status = state
+        state[5, 6] = 2
+        self.gui.status = state
+        assert len(updates) == 2
+        assert self.gui.status[5, 6] == 2
+
+    def test_paint(self):
+        widget = self.gui.widgets['status']
+        widget.resize(widget.sizeHint())
+        self.gui.status = np.ones((16, 32), dtype=bool)
+        image = widget.grab().toImage()
+        assert image.pixelColor(1, 1).green() > 100
+
+    def test_wrong_size(self):
+        with self.assertRaises(ValueError):
+            self.gui.status = [1, 2, 3]
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+from unittest import mock
+from guietta import guietta
+from guietta.guietta import Gui, HS
+
+
+class ObserveTest(unittest.TestCase):
+
+    def setUp(self):
+        self.gui = Gui(['__a__', HS('b'), 'c'])
+        self.calls = []
+
+    def _callback(self, gui, changed):
+        self.calls.append(changed)
+
+    def _process(self):
+        self.gui._app.processEvents()
+
+    def test_batched(self):
+        self.gui.observe(['a', 'b'], self._callback)
+        self.gui.a = 'foo'
+        self.gui.b = 10
+        self.gui.c = 'not observed'
+        assert self.calls == []
+        self._process()
+        assert self.calls == [frozenset(['a', 'b'])]
+
+    def test_user_changes(self):
+        self.gui.observe(None, self._callback)
+        self.gui.widgets['b'].setValue(42)
+        self.gui.widgets['a'].setText('typed')
+        self._process()
+        assert self.calls == [frozenset(['a', 'b'])]
+
+    def test_same_value_not_notified(self):
+        self.gui.observe('b', self._callback)
+        self.gui.widgets['b'].setValue(0)
+        self._process()
+        assert self.calls == []
+
+    def test_unsubscribe(self):
+        subscription = self.gui.observe('a', self._callback)
+        assert subscription.active
+        self.gui.a = 'foo'
+        subscription.unsubscribe()
+        assert not subscription.active
+        self._process()
+        assert self.calls == []
+
+    def test_keys_only_for_observed_names(self):
+        def count_keys(name, value):
+            with mock.patch('guietta.guietta._value_key',
+                            side_effect=guietta._value_key) as value_key:
+                setattr(self.gui, name, value)
+            return value_key.call_count
+
+        unobserved = count_keys('c', 'foo')
+        self.gui.observe('c', self._callback)
+        count_keys('c', 'bar')
+        # Only the new value is hashed, the old key is remembered
+        assert count_keys('c', 'baz') == unobserved + 1
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+import time
+import unittest
+import itertools
+from guietta.guietta import Gui, Exceptions
+
+from PySide2.QtWidgets import QApplication
+
+
+class PollTest(unittest.TestCase):
+
+    def setUp(self):
+        self.gui = Gui(['label'], exceptions=Exceptions.SILENT)
+
+    def test_target_gets_newest_value(self):
+        counter = itertools.count()
+        task = self.gui.poll(lambda: min(next(counter), 10), 0.001,
+                             target='label')
+        while task.ticks < 12:
+            time.sleep(0.01)
+        QApplication.instance().processEvents()
+        task.cancel()
+        task.join()
+        assert self.gui.label == '10'
+
+    def test_callback_is_coalesced(self):
+        results = []
+        task = self.gui.poll(lambda: 1, 0.001,
+                             callback=lambda gui, x: results.append(x))
+        time.sleep(0.05)
+        QApplication.instance().processEvents()
+        task.cancel()
+        task.join()
+        assert results == [1]
+
+    def test_cancel_discards_pending_values(self):
+        results = []
+        task = self.gui.poll(lambda: 1, 0.001,
+                             callback=lambda gui, x: results.append(x))
+        time.sleep(0.02)
+        task.cancel()
+        task.join()
+        QApplication.instance().processEvents()
+        assert results == []
+
+    def test_unknown_target(self):
+        with self.assertRaises(AttributeError):
+            self.gui.poll(lambda: 1, 0.001, target='lable')
+        assert len(self.gui._tasks) == 0
+
+    def test_overrun_skips_ticks(self):
+        task = self.gui.poll(lambda: time.sleep(0.03), 0.01)
+        time.sleep(0.1)
+        task.cancel()
+        task.join()
+        assert task.skipped_ticks > 0
+
+    def test_exception_stops_polling(self):
+        task = self.gui.poll(lambda: 1 / 0, 0.001)
+        task.join(5)
+        assert task.cancelled
+        assert task.ticks == 0
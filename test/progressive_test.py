@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+from guietta.guietta import Gui, _, ___, III, _row_chunks
+
+
+class ProgressiveTest(unittest.TestCase):
+
+    def _rows(self, n):
+        return [['label%d' % i, '__edit%d__' % i] for i in range(n)]
+
+    def test_chunks_keep_continuations(self):
+        rows = [['a', 'b'], [III, 'c'], ['d', 'e'], ['f', III]]
+        assert list(_row_chunks(rows)) == [rows[:2], rows[2:]]
+
+    def test_first_chunk_only(self):
+        gui = Gui(*self._rows(200), progressive=1e-6)
+        assert gui.building
+        assert len(gui._widgets) < 400
+
+        while gui.building:
+            gui._app.processEvents()
+        assert len(gui._widgets) == 400
+        assert gui.layout().itemAtPosition(199, 1).widget() is \
+            gui._widgets['edit199']
+
+    def test_access_builds_up_to_name(self):
+        gui = Gui(*self._rows(200), progressive=1e-6)
+        assert gui.building
+        gui.edit150 = 'foo'
+        assert gui.building
+        assert len(gui._rows) == 151
+        assert gui.edit150 == 'foo'
+        assert gui.label10 == 'label10'
+        assert len(gui._rows) == 151
+
+    def test_coordinates_and_events_build_up_to_row(self):
+        gui = Gui(*self._rows(200), progressive=1e-6)
+        assert gui[20, 0] is gui._widgets['label20']
+        assert len(gui._rows) == 21
+        gui.events(*[[_, _]] * 50)
+        assert len(gui._rows) == 50
+        assert gui.building
+
+    def test_full_build(self):
+        gui = Gui(*self._rows(200), progressive=1e-6)
+        assert len(gui.widgets) == 400
+        assert not gui.building
+
+    def test_unknown_name_finishes(self):
+        gui = Gui(*self._rows(200), progressive=1e-6)
+        with self.assertRaises(AttributeError):
+            gui.nonexistent
+        assert not gui.building
+
+    def test_same_layout(self):
+        rows = [['a', ___, 'b'],
+                [III, III, 'c'],
+                ['d', 'e', 'f']]
+        gui = Gui(*rows, progressive=1e-6)
+        assert gui[1, 0] is gui.widgets['a']
+        assert gui[2, 2] is gui.widgets['f']
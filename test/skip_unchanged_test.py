@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+from guietta.guietta import Gui, HS, _value_key, _same_key
+
+from PySide2.QtWidgets import QLabel
+
+
+class ValueKeyTest(unittest.TestCase):
+
+    def test_scalars(self):
+        assert _same_key(_value_key('a'), _value_key('a'))
+        assert not _same_key(_value_key(1), _value_key(1.0))
+        assert not _same_key(_value_key(1), _value_key(True))
+
+    def test_mutable_sequences_are_copied(self):
+        lst = [1, 2]
+        key = _value_key(lst)
+        lst.append(3)
+        assert not _same_key(key, _value_key(lst))
+
+    def test_unknown_objects(self):
+        assert _value_key(object()) is None
+
+
+class SkipUnchangedTest(unittest.TestCase):
+
+    def setUp(self):
+        self.gui = Gui([(QLabel('x'), 'label'), HS('slider'), '__edit__'])
+
+    def test_skip(self):
+        widget = self.gui.widgets['label']
+        calls = []
+        widget.setText = lambda text: calls.append(text)
+        self.gui.label = 'foo'
+        self.gui.label = 'foo'
+        self.gui.label = 'bar'
+        assert calls == ['foo', 'bar']
+        assert self.gui.proxy('label').skipped == 1
+
+    def test_user_change_invalidates(self):
+        self.gui.edit = 'foo'
+        self.gui.widgets['edit'].setText('typed')
+        self.gui.edit = 'foo'
+        assert self.gui.edit == 'foo'
+        assert self.gui.proxy('edit').skipped == 0
+
+        self.gui.slider = 10
+        self.gui.widgets['slider'].setValue(20)
+        self.gui.slider = 10
+        assert self.gui.slider == 10
+
+    def test_invalidate(self):
+        self.gui.label = 'foo'
+        self.gui.widgets['label'].setText('direct')
+        self.gui.proxy('label').invalidate()
+        self.gui.label = 'foo'
+        assert self.gui.label == 'foo'
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+from guietta.guietta import Gui, T
+
+from PySide2.QtCore import Qt
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, 'numpy not installed')
+class TableTest(unittest.TestCase):
+
+    def setUp(self):
+        self.gui = Gui([T('table')])
+        self.model = self.gui.widgets['table'].model()
+
+    def cell(self, row, col):
+        return self.model.data(self.model.index(row, col))
+
+    def test_2d_array(self):
+        arr = np.arange(200000, dtype=float).reshape(100000, 2)
+        self.gui.table = arr
+        assert self.gui.table is arr
+        assert self.model.rowCount() == 100000
+        assert self.model.columnCount() == 2
+        assert self.cell(99999, 1) == '199999'
+        assert len(self.model._blocks) == 1
+
+    def test_record_array(self):
+        arr = np.array([(1, 2.5), (2, 0.5)], dtype=[('id', int), ('x', float)])
+        self.gui.table = arr
+        assert self.model.headerData(1, Qt.Horizontal) == 'x'
+        assert self.cell(0, 1) == '2.5'
+
+    def test_sort(self):
+        self.gui.table = np.array([[3], [1], [2]])
+        self.model.sort(0, Qt.DescendingOrder)
+        assert [self.cell(i, 0) for i in range(3)] == ['3', '2', '1']
+        assert self.model.headerData(0, Qt.Vertical) == '0'
+        self.model.sort(0, Qt.AscendingOrder)
+        assert [self.cell(i, 0) for i in range(3)] == ['1', '2', '3']
+
+    def test_update_rows(self):
+        arr = np.zeros((10, 2))
+        self.gui.table = arr
+        changed = []
+        self.model.dataChanged.connect(lambda a, b: changed.append((a.row(), b.row())))
+        self.gui.widgets['table'].update_rows([3, 5], [[1, 2], [3, 4]])
+        assert self.cell(5, 1) == '4'
+        assert arr[3, 0] == 1
+        assert changed == [(3, 5)]
+
+    def test_update_sorted_rows(self):
+        self.gui.table = np.array([[3], [1], [2]])
+        self.model.sort(0, Qt.DescendingOrder)
+        changed = []
+        self.model.dataChanged.connect(lambda a, b: changed.append((a.row(), b.row())))
+        self.model.update_rows(1, [[0]])
+        inverse = self.model._inverse
+        self.model.update_rows(0, [[4]])
+        assert self.model._inverse is inverse
+        assert changed == [(2, 2), (0, 0)]
+        assert [self.cell(i, 0) for i in range(3)] == ['4', '2', '0']
+
+        self.model.sort(0, Qt.AscendingOrder)
+        self.model.update_rows(2, [[5]])
+        assert self.model._inverse is not inverse
+        assert [self.cell(i, 0) for i in range(3)] == ['0', '5', '4']
+
+    def test_same_shape_keeps_model(self):
+        self.gui.table = np.zeros((5, 2))
+        resets = []
+        self.model.modelReset.connect(lambda: resets.append(1))
+        self.gui.table = np.ones((5, 2))
+        assert self.cell(0, 0) == '1'
+        assert resets == []
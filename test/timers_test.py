@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+import time
+import unittest
+from guietta.guietta import Gui, TimerPolicy, _NamedTimer
+
+from PySide2.QtWidgets import QApplication
+
+
+class TimersTest(unittest.TestCase):
+
+    def setUp(self):
+        self.gui = Gui(['label'])
+
+    def run_events(self, seconds):
+        app = QApplication.instance()
+        end = time.perf_counter() + seconds
+        while time.perf_counter() < end:
+            app.processEvents()
+
+    def test_named_timers(self):
+
+        @self.gui.timer('fast', 0.01, precise=True)
+        def fast(gui):
+            pass
+
+        @self.gui.timer('slow', 0.05)
+        def slow(gui):
+            pass
+
+        self.run_events(0.2)
+        self.gui.timer_stop()
+        fast_count = self.gui.timer_count('fast')
+        slow_count = self.gui.timer_count('slow')
+        assert fast_count > slow_count > 0
+
+        self.run_events(0.05)
+        assert self.gui.timer_count('fast') == fast_count
+
+    def test_decorator_with_name_only(self):
+
+        @self.gui.timer('named')
+        def named(gui):
+            pass
+
+        assert callable(named)
+        assert self.gui.timer_stats('named').count == 0
+        self.gui.timer_stop('named')
+
+    def test_default_timer(self):
+        self.gui.timer_start(lambda gui: None, interval=0.01)
+        self.run_events(0.05)
+        self.gui.timer_stop()
+        assert self.gui.timer_count() > 0
+        assert self.gui.timer_count('nonexistent') == 0
+
+    def test_skip_policy(self):
+        self.gui.timer_start(lambda gui: time.sleep(0.03), 0.01, name='slow',
+                             policy=TimerPolicy.SKIP)
+        self.run_events(0.1)
+        self.gui.timer_stop('slow')
+        stats = self.gui.timer_stats('slow')
+        assert stats.overruns > 0
+        assert stats.skipped > 0
+
+    def test_catch_up_policy(self):
+        self.gui.timer_start(lambda gui: time.sleep(0.015), 0.01, name='slow',
+                             policy=TimerPolicy.CATCH_UP)
+        self.run_events(0.1)
+        self.gui.timer_stop('slow')
+        stats = self.gui.timer_stats('slow')
+        assert stats.overruns > 0
+        assert stats.skipped == 0
+
+    def test_deadline_advances_on_exception(self):
+
+        def fail():
+            raise ValueError
+
+        timer = _NamedTimer()
+        timer.start(fail, 10, False, TimerPolicy.SKIP)
+        deadline = timer.deadline
+        with self.assertRaises(ValueError):
+            timer.fire(deadline)
+        assert timer.deadline == deadline + 10
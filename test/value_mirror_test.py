@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+import threading
+from guietta.guietta import Gui, HS, C, CB, _
+
+
+class ValueMirrorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.gui = Gui(['label', HS('slider')], ['__edit__', _])
+
+    def read_in_thread(self, name):
+        result = []
+        t = threading.Thread(target=lambda: result.append(getattr(self.gui, name)))
+        t.start()
+        t.join()
+        return result[0]
+
+    def test_property_set(self):
+        self.gui.label = 'foo'
+        assert self.read_in_thread('label') == 'foo'
+
+    def test_widget_change_signal(self):
+        self.gui.widgets['slider'].setValue(42)
+        self.gui.widgets['edit'].setText('bar')
+        assert self.read_in_thread('slider') == 42
+        assert self.read_in_thread('edit') == 'bar'
+
+    def test_snapshot(self):
+        version = self.gui.snapshot().version
+        self.gui.slider = 10
+        snapshot = self.gui.snapshot()
+        assert snapshot.version > version
+        assert snapshot.values['slider'] == 10
+        assert snapshot.values['label'] == 'label'
+
+    def test_snapshot_is_a_copy(self):
+        snapshot = self.gui.snapshot()
+        self.gui.slider = 20
+        assert snapshot.values['slider'] == 0
+
+    def test_unknown_name(self):
+        with self.assertRaises(AttributeError):
+            self.gui._mirror.get('nonexistent')
+
+
+class ValueMirrorButtonsTest(unittest.TestCase):
+
+    def test_checkbox_and_combobox(self):
+        gui = Gui([C('check'), CB('combo', {'a': 1, 'b': 2})])
+        version = gui.snapshot().version
+
+        gui.widgets['check'].setChecked(True)
+        assert gui.snapshot().version > version
+        version = gui.snapshot().version
+
+        gui.widgets['combo'].setCurrentIndex(1)
+        assert gui.snapshot().version > version
+        assert gui.snapshot().values['combo'] == {'a': 1, 'b': 2}
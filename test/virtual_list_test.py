@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+from guietta.guietta import Gui, LB
+
+
+class VirtualListTest(unittest.TestCase):
+
+    def setUp(self):
+        self.gui = Gui([LB('log', virtual=True)])
+
+    def test_sequence_is_not_copied(self):
+        entries = list(range(100000))
+        self.gui.log = entries
+        assert self.gui.log is entries
+        assert self.gui.widgets['log'].model().rowCount() == 100000
+
+    def test_lazy_string_conversion(self):
+        self.gui.log = range(10)
+        model = self.gui.widgets['log'].model()
+        assert model.data(model.index(3)) == '3'
+
+    def test_current_text_signal(self):
+        texts = []
+        widget = self.gui.widgets['log']
+        widget.currentTextChanged.connect(texts.append)
+        self.gui.log = ['a', 'b', 'c']
+        widget.setCurrentIndex(widget.model().index(1))
+        assert texts == ['b']
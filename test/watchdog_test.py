@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+import threading
+import time
+import unittest
+from guietta.guietta import Gui, StallError, _exception_wrapper
+from guietta.guietta import _running_slots
+
+
+def blocking_slot(gui, *args):
+    time.sleep(0.4)
+
+
+class WatchdogTest(unittest.TestCase):
+
+    def setUp(self):
+        self.errors = []
+        self.gui = Gui(['label'], exceptions=self._handler)
+
+    def tearDown(self):
+        self.gui.stop_watchdog()
+
+    def _handler(self):
+        self.errors.append(True)
+
+    def _spin(self, seconds):
+        end = time.monotonic() + seconds
+        while time.monotonic() < end:
+            self.gui._app.processEvents()
+            time.sleep(0.005)
+
+    def test_callback(self):
+        stalls = []
+        self.gui.start_watchdog(threshold=0.1, callback=stalls.append)
+        self._spin(0.1)
+        _exception_wrapper(blocking_slot, self.gui)(self.gui)
+
+        assert len(stalls) == 1
+        error = stalls[0]
+        assert isinstance(error, StallError)
+        assert error.slot == 'blocking_slot'
+        assert 'blocking_slot' in error.stack
+        assert error.duration > 0.1
+
+    def test_no_stall(self):
+        watchdog = self.gui.start_watchdog(threshold=0.2)
+        self._spin(0.4)
+        assert watchdog.stalls == []
+
+    def test_exception_mode(self):
+        watchdog = self.gui.start_watchdog(threshold=0.1)
+        self._spin(0.1)
+        _exception_wrapper(blocking_slot, self.gui)(self.gui)
+        self._spin(0.05)
+        assert len(watchdog.stalls) == 1
+        assert self.errors == [True]
+
+    def test_armed_by_first_heartbeat(self):
+        stalls = []
+        self.gui.start_watchdog(threshold=0.05, callback=stalls.append)
+        time.sleep(0.2)
+        assert stalls == []
+        self._spin(0.05)
+        time.sleep(0.2)
+        assert len(stalls) == 1
+
+    def test_no_entries_for_finished_threads(self):
+        thread = threading.Thread(
+            target=_exception_wrapper(lambda gui: None, self.gui),
+            args=(self.gui,))
+        thread.start()
+        thread.join()
+        assert thread.ident not in _running_slots
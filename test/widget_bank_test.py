@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+from guietta.guietta import Gui, WB, HS, Led, L, P
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, 'numpy not installed')
+class WidgetBankTest(unittest.TestCase):
+
+    def setUp(self):
+        self.gui = Gui([WB('sliders', HS, (4, 16))],
+                       [WB('leds', Led, 8)],
+                       [WB('labels', L, 3)],
+                       [WB('bars', P, 2)])
+
+    def test_shape(self):
+        assert self.gui.sliders.shape == (4, 16)
+        assert self.gui.leds.shape == (1, 8)
+
+    def test_set_only_changed(self):
+        bank = self.gui.widgets['sliders']
+        calls = []
+        bank.widgets[5].setValue = lambda v: calls.append(v)
+        values = np.zeros((4, 16))
+        values[2, 3] = 42
+        self.gui.sliders = values
+        assert calls == []
+        assert bank.widgets[2 * 16 + 3].value() == 42
+        assert (self.gui.sliders == values).all()
+
+    def test_user_change(self):
+        changes = []
+        bank = self.gui.widgets['sliders']
+        bank.changed.connect(lambda: changes.append(1))
+        bank.widgets[7].setValue(10)
+        assert self.gui.sliders[0, 7] == 10
+        assert changes == [1]
+
+    def test_leds_and_labels(self):
+        self.gui.leds = [True, False] * 4
+        assert self.gui.widgets['leds'].widgets[0]._state is True
+        self.gui.labels = ['a', 'b', 'c']
+        assert self.gui.widgets['labels'].widgets[2].text() == 'c'
+
+    def test_wrong_size(self):
+        with self.assertRaises(ValueError):
+            self.gui.leds = [True, False]
+
+    def test_label_strings(self):
+        labels = self.gui.widgets['labels'].widgets
+        self.gui.labels = ['ab', 'cd', 'ef']
+        self.gui.labels = ['a', 'c', 'e']
+        assert [w.text() for w in labels] == ['a', 'c', 'e']
+        self.gui.labels = [1, 2.5, 'x']
+        assert [w.text() for w in labels] == ['1', '2.5', 'x']
+
+    def test_read_back_widget_values(self):
+        bank = self.gui.widgets['sliders']
+        values = np.zeros((4, 16))
+        values[0, :3] = [150, 42.7, -5]
+        self.gui.sliders = values
+        widgets = [w.value() for w in bank.widgets[:3]]
+        assert widgets == [99, 42, 0]
+        assert self.gui.sliders[0, :3].tolist() == widgets
+
+    def test_read_back_progress_bars(self):
+        bars = self.gui.widgets['bars'].widgets
+        self.gui.bars = [[250, 50]]
+        widgets = [w.value() for w in bars]
+        assert widgets == [0, 50]
+        assert self.gui.bars.tolist() == [widgets]
+
+    def test_read_back_labels(self):
+        self.gui.labels = [1, 2.5, 'x']
+        assert self.gui.labels.tolist() == [['1', '2.5', 'x']]
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+from guietta.guietta import Gui, GuiettaProperty, register_widget_type
+from guietta.guietta import _default_signal_lookup, _TypeRegistry
+
+from PySide2.QtCore import Signal
+from PySide2.QtWidgets import QWidget, QPushButton, QAbstractButton
+
+
+class Knob(QWidget):
+
+    turned = Signal(int)
+
+    def __init__(self):
+        super().__init__()
+        self.angle = 0
+
+
+class BigKnob(Knob):
+    pass
+
+
+def _knob_property(widget):
+
+    def get():
+        return widget.angle
+
+    def set(value):
+        widget.angle = value
+        widget.turned.emit(value)
+
+    return GuiettaProperty(get, set, widget)
+
+
+register_widget_type(Knob, property=_knob_property, default_signal='turned',
+                     change_signal='turned')
+
+
+class WidgetRegistryTest(unittest.TestCase):
+
+    def test_registered_type(self):
+        gui = Gui([(BigKnob(), 'knob')])
+        gui.knob = 30
+        assert gui.knob == 30
+        assert _default_signal_lookup(gui.widgets['knob']) == 'turned'
+
+    def test_events(self):
+        gui = Gui([(Knob(), 'knob')])
+        calls = []
+        gui.events([lambda gui, value: calls.append(value)])
+        gui.widgets['knob'].turned.emit(5)
+        assert calls == [5]
+
+    def test_mro_and_cache(self):
+        registry = _TypeRegistry({QAbstractButton: 'a', QPushButton: 'b'})
+        assert registry.lookup(QPushButton) == 'b'
+        assert registry.lookup(QWidget, 'none') == 'none'
+        registry.register(QWidget, 'c')
+        assert registry.lookup(QWidget) == 'c'
+
+    def test_unknown(self):
+        with self.assertRaises(KeyError):
+            _default_signal_lookup(QWidget())